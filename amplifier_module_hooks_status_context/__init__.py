@@ -6,9 +6,19 @@ Injects current git status and datetime into agent context before each prompt.
 # Amplifier module metadata
 __amplifier_module_type__ = "hook"
 
+import asyncio
+import fnmatch
 import logging
+import os
 import platform
+import re
+import shutil
 import subprocess
+import tempfile
+import time
+import weakref
+from collections.abc import AsyncIterator, Iterable, Iterator
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -64,6 +74,208 @@ DEFAULT_TIER2_PATTERNS = [
     "*.map",
 ]
 
+# Process-constant platform details (platform.platform() reads OS release files)
+_PLATFORM_NAME = platform.system().lower()
+_OS_VERSION = platform.platform()
+
+# Local (standard, daylight) timezone names, selected by the current DST flag
+_LOCAL_TZNAMES = time.tzname
+
+# Wrapper around the injected context
+_REMINDER_OPEN = '<system-reminder source="hooks-status-context">\n'
+_REMINDER_END = "\n</system-reminder>"
+_REMINDER_CLOSE = (
+    "\n\nThis context is for your reference only. DO NOT mention this status information "
+    "to the user unless directly relevant to their question. Process silently and "
+    "continue your work." + _REMINDER_END
+)
+
+# <env> block layout; optional blocks end with their own newline
+_ENV_TEMPLATE = (
+    "Here is useful information about the environment you are running in:\n"
+    "<env>\n"
+    "Working directory: %(working_dir)s\n"
+    "%(session_block)s"
+    "%(bundles_block)s"
+    "Is directory a git repo: %(is_git_repo)s\n"
+    "Platform: %(platform)s\n"
+    "OS Version: %(os_version)s\n"
+    "%(date_block)s"
+    "</env>"
+)
+_ENV_DATE_BLOCK = "Today's date: %s\n"
+_ENV_SESSION_BLOCK = "Session ID: %s\nIs sub-session: No\n"
+_ENV_SUB_SESSION_BLOCK = "Session ID: %s\nParent Session ID: %s\nIs sub-session: Yes\n"
+_ENV_BUNDLES_BLOCK = "Loaded bundles: %s\n"
+# strftime formats for the configurable time_resolution
+_TIME_FORMATS = {
+    "day": "%Y-%m-%d",
+    "hour": "%Y-%m-%d %H:00",
+    "minute": "%Y-%m-%d %H:%M",
+    "second": "%Y-%m-%d %H:%M:%S",
+}
+
+_GIT_PREAMBLE = (
+    "gitStatus: This is the git status at the start of the conversation. "
+    "Note that this status is a snapshot in time, and will not update during the conversation."
+)
+_STATUS_UNAVAILABLE = "(unavailable: git status failed or timed out)"
+_ENV_UNAVAILABLE = (
+    "Here is useful information about the environment you are running in:\n"
+    "<env>\nEnvironment information unavailable\n</env>"
+)
+
+# Number of space-separated fields before the path in porcelain v2 records
+_PORCELAIN_V2_PATH_FIELD = {"1": 8, "2": 9, "u": 10}
+
+# Bytes read from a streaming git subprocess at a time
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass(slots=True)
+class EnvInfo:
+    """Environment information gathered for one request, with its formatted block."""
+
+    working_dir: str
+    is_git_repo: bool
+    platform: str
+    os_version: str
+    date: str
+    session_id: str | None
+    parent_session_id: str | None
+    is_sub_session: bool
+    formatted: str
+
+
+def _compile_tier_patterns(
+    patterns: list[str],
+) -> tuple[tuple[str, ...], re.Pattern[str] | None]:
+    """Compile tier patterns into a prefix tuple and a single union regex.
+
+    Args:
+        patterns: Glob patterns; those ending in "/**" are treated as path prefixes
+
+    Returns:
+        Tuple of (prefixes for str.startswith, compiled union of the remaining globs)
+    """
+    prefixes = tuple(p[:-3] for p in patterns if p.endswith("/**"))
+    globs = [p for p in patterns if not p.endswith("/**")]
+    regex = re.compile("|".join(fnmatch.translate(g) for g in globs)) if globs else None
+    return prefixes, regex
+
+
+class _PorcelainV2Parser:
+    """Incremental parser for `git status --porcelain=v2 -z --branch` records.
+
+    Records may arrive in several batches; a rename whose original path has not
+    been seen yet is held over to the next batch.
+    """
+
+    def __init__(self):
+        self.branch: str | None = None
+        self._pending_rename: tuple[str, str] | None = None
+
+    def feed(self, records: Iterable[str]) -> Iterator[tuple[str, str, str]]:
+        """
+        Parse a batch of records into short-format lines.
+
+        Records have fixed field layouts and unquoted NUL-terminated paths, so each
+        one is split at a known field count instead of trimmed.
+
+        Args:
+            records: Status records with their NUL terminators removed
+
+        Yields:
+            Tuple of (line, status_code, filepath) where line is in `--short` form
+            (e.g., " M file.py", "R  old.py -> new.py", "?? new.txt")
+        """
+        for record in records:
+            if self._pending_rename is not None:
+                # Renames and copies are followed by a record holding the original path
+                status, path = self._pending_rename
+                self._pending_rename = None
+                yield f"{status} {record} -> {path}", status, path
+                continue
+            kind = record[:1]
+            if kind == "?":
+                path = record[2:]
+                yield f"?? {path}", "??", path
+                continue
+            if kind == "#":
+                if record.startswith("# branch.head "):
+                    head = record[len("# branch.head ") :]
+                    self.branch = None if head == "(detached)" else head
+                continue
+            path_field = _PORCELAIN_V2_PATH_FIELD.get(kind)
+            if path_field is None:
+                # Ignored entries, trailing terminator
+                continue
+            fields = record.split(" ", path_field)
+            status = fields[1].replace(".", " ")
+            path = fields[path_field]
+            if kind == "2":
+                self._pending_rename = (status, path)
+            else:
+                yield f"{status} {path}", status, path
+
+
+class _StatusBuckets:
+    """Per-tier status lines, kept only up to each display cap and counted beyond it."""
+
+    def __init__(
+        self,
+        max_tracked: int,
+        max_untracked: int,
+        tier2_limit: int,
+        include_untracked: bool,
+    ):
+        self.max_tracked = max_tracked
+        self.max_untracked = max_untracked
+        self.tier2_limit = tier2_limit
+        self.include_untracked = include_untracked
+        self.tier1_tracked_count = 0
+        self.tier1_tracked_examples: list[str] = []
+        self.tier1_untracked_count = 0
+        self.tier2_count = 0
+        self.tier2_lines: list[str] = []
+        self.tier3_tracked_count = 0
+        self.tier3_tracked: list[str] = []
+        self.tier3_untracked_count = 0
+        self.tier3_untracked: list[str] = []
+        # Index entry count when the untracked scan was skipped by the threshold
+        self.untracked_skipped_entries: int | None = None
+
+    def add(self, tier: str, status: str, line: str) -> None:
+        """Count a classified status line, keeping it if its bucket has room."""
+        if tier == "tier1":
+            if status == "??":
+                self.tier1_untracked_count += 1
+            else:
+                self.tier1_tracked_count += 1
+                if len(self.tier1_tracked_examples) < 3:
+                    self.tier1_tracked_examples.append(line)
+        elif tier == "tier2":
+            self.tier2_count += 1
+            if len(self.tier2_lines) < self.tier2_limit:
+                self.tier2_lines.append(line)
+        elif status == "??":
+            if self.include_untracked:
+                self.tier3_untracked_count += 1
+                if len(self.tier3_untracked) < self.max_untracked:
+                    self.tier3_untracked.append(line)
+        else:
+            self.tier3_tracked_count += 1
+            if len(self.tier3_tracked) < self.max_tracked:
+                self.tier3_tracked.append(line)
+
+
+def _unlink_quietly(path: str) -> None:
+    """Remove a file, ignoring errors (used for temp file finalizers)."""
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
 
 async def mount(coordinator: ModuleCoordinator, config: dict[str, Any] | None = None):
     """
@@ -74,33 +286,43 @@ async def mount(coordinator: ModuleCoordinator, config: dict[str, Any] | None =
         config: Optional configuration
             - working_dir: Working directory for operations (default: ".")
             - include_git: Enable git status injection (default: True)
+            - git_detect_use_rev_parse: Fall back to `git rev-parse` for repo detection (default: False)
             - git_include_status: Include working directory status (default: True)
             - git_include_commits: Number of recent commits (default: 5)
             - git_include_branch: Include current branch (default: True)
             - git_include_main_branch: Detect main branch (default: True)
+            - git_ref_helper: Resolve refs with a long-lived `git cat-file` process (default: False)
             - git_status_include_untracked: Include untracked files (default: True)
             - git_status_max_untracked: Max untracked files to show (default: 20, 0=unlimited)
             - git_status_max_lines: Hard limit on total status lines (default: 100)
+            - git_status_ignore_submodules: Skip submodule scanning (default: True)
+            - git_status_uno_threshold: Skip untracked scan above this many index entries (default: 0=never)
+            - git_status_cache_ttl: Seconds to reuse status while index and top-level directory mtimes are unchanged (default: 0=disabled)
             - git_status_enable_path_filtering: Enable tier-based path filtering (default: True)
             - git_status_tier1_patterns_extend: Additional Tier 1 patterns to ignore (default: [])
             - git_status_tier2_patterns_extend: Additional Tier 2 patterns to limit (default: [])
             - git_status_tier2_limit: Max Tier 2 files to show (default: 10)
+            - git_status_tier1_check_ignore: Match Tier 1 with `git check-ignore`, one call per 64 KiB of status output (default: False)
             - git_status_max_tracked: Max tracked files to show (default: 50)
             - git_status_show_filter_summary: Show filtering messages (default: True)
             - include_datetime: Enable datetime injection (default: True)
             - datetime_include_timezone: Include timezone name (default: False)
+            - time_resolution: Precision of the time shown: day, hour, minute, or second (default: "second")
+            - split_volatile_context: Put date and status in a second reminder block (default: False)
             - include_session: Enable session ID injection (default: True)
             - include_bundles: Enable loaded bundles injection (default: True)
+            - context_cache_ttl: Seconds to reuse an unchanged injection (default: 0=disabled)
+            - min_refresh_interval: Seconds to reuse an injection without checking for changes (default: 0=disabled)
             - priority: Hook priority (default: 0)
 
     Returns:
-        Optional cleanup function
+        Cleanup coroutine function when the ref helper is enabled, else None
     """
     config = config or {}
     hook = StatusContextHook(coordinator, config)
     hook.register(coordinator.hooks)
     logger.info("Mounted hooks-status-context")
-    return
+    return hook.close if hook.git_ref_helper else None
 
 
 class StatusContextHook:
@@ -121,6 +343,7 @@ class StatusContextHook:
 
         # Working directory
         self.working_dir = config.get("working_dir", ".")
+        self.refresh_cwd()
 
         # Git context options
         self.include_git = config.get("include_git", True)
@@ -136,6 +359,17 @@ class StatusContextHook:
         self.git_status_max_untracked = config.get("git_status_max_untracked", 20)
         self.git_status_max_lines = config.get("git_status_max_lines", 100)
 
+        # Git status scan cost options
+        self.git_status_ignore_submodules = config.get(
+            "git_status_ignore_submodules", True
+        )
+        self.git_status_uno_threshold = config.get("git_status_uno_threshold", 0)
+
+        # Status reuse while the index and worktree directory mtimes are unchanged:
+        # (key, created_at, (branch, formatted status))
+        self.git_status_cache_ttl = config.get("git_status_cache_ttl", 0)
+        self._status_cache: tuple[tuple, float, tuple[str | None, str]] | None = None
+
         # Tier-based filtering (NEW - safe by default)
         self.git_status_enable_path_filtering = config.get(
             "git_status_enable_path_filtering", True
@@ -147,6 +381,18 @@ class StatusContextHook:
             "git_status_tier2_patterns_extend", []
         )
         self.git_status_tier2_limit = config.get("git_status_tier2_limit", 10)
+        self._tier1_matcher = _compile_tier_patterns(self.tier1_patterns)
+        self._tier2_matcher = _compile_tier_patterns(self.tier2_patterns)
+
+        # Optional: let git's C matcher classify Tier 1 in one batch call
+        self.git_status_tier1_check_ignore = config.get(
+            "git_status_tier1_check_ignore", False
+        )
+        self._tier1_excludes_file: str | None = None
+        # Path from each resolved working directory up to its repo root
+        self._show_cdup_cache: dict[str, str] = {}
+        if self.git_status_tier1_check_ignore and self.git_status_enable_path_filtering:
+            self._tier1_excludes_file = self._write_tier1_excludes_file()
 
         # Hard limits (NEW - safe by default)
         self.git_status_max_tracked = config.get("git_status_max_tracked", 50)
@@ -159,16 +405,81 @@ class StatusContextHook:
         # Datetime options
         self.include_datetime = config.get("include_datetime", True)
         self.datetime_include_timezone = config.get("datetime_include_timezone", False)
+        self.time_resolution = config.get("time_resolution", "second")
+        if self.time_resolution not in _TIME_FORMATS:
+            logger.warning(
+                f"Unknown time_resolution {self.time_resolution!r}, using 'second'"
+            )
+            self.time_resolution = "second"
+        self._time_format = _TIME_FORMATS[self.time_resolution]
+
+        # Stable context first, then date and status in their own reminder block, so
+        # the first block stays byte-identical across turns
+        self.split_volatile_context = config.get("split_volatile_context", False)
 
         # Session options
         self.include_session = config.get("include_session", True)
 
         # Bundle options
         self.include_bundles = config.get("include_bundles", True)
+        self._bundles_snapshot: tuple[tuple[int, int], tuple[str, ...]] | None = None
+
+        # With every section disabled there is nothing worth injecting
+        self._any_enabled = any(
+            [
+                self.include_git,
+                self.include_datetime,
+                self.include_session,
+                self.include_bundles,
+            ]
+        )
 
         # Hook priority
         self.priority = config.get("priority", 0)
 
+        # Injection cache: (key, created_at, context_injection), see _context_cache_key
+        self.context_cache_ttl = config.get("context_cache_ttl", 0)
+        self.min_refresh_interval = config.get("min_refresh_interval", 0.0)
+        self._ctx_cache: tuple[tuple, float, str] | None = None
+
+        # Environment for git subprocesses, built once: the user's environment
+        # (GIT_DIR, config, PATH) is kept, but tracing and credential prompts are off
+        self._git_env = {
+            key: value for key, value in os.environ.items() if not key.startswith("GIT_TRACE")
+        }
+        self._git_env.update(GIT_OPTIONAL_LOCKS="0", GIT_TERMINAL_PROMPT="0")
+
+        # Absolute path to git, looked up on PATH once (None if git is not installed)
+        self._git_exe = shutil.which("git", path=self._git_env.get("PATH"))
+
+        # Absolute git dir, captured during repo detection (cached per resolved cwd)
+        self.git_detect_use_rev_parse = config.get("git_detect_use_rev_parse", False)
+        self._git_dir: str | None = None
+        self._git_dir_cache: dict[str, str | None] = {}
+
+        # Git query results per resolved working directory: (validator, output),
+        # reused until the ref metadata mtimes in the validator change
+        self._main_branch_cache: dict[str, tuple[tuple, str | None]] = {}
+        self._log_cache: dict[str, tuple[tuple, str | None]] = {}
+
+        # Optional long-lived `git cat-file --batch-check` process for ref lookups
+        self.git_ref_helper = config.get("git_ref_helper", False)
+        self._ref_helper: asyncio.subprocess.Process | None = None
+        self._ref_helper_cwd: str | None = None
+        self._ref_helper_lock = asyncio.Lock()
+
+    def refresh_cwd(self) -> None:
+        """Resolve working_dir against the process cwd (call again after a chdir)."""
+        working_dir_path = Path(self.working_dir)
+        if not working_dir_path.is_absolute():
+            working_dir_path = Path.cwd() / working_dir_path
+        self._resolved_cwd = str(working_dir_path)
+
+    async def close(self) -> None:
+        """Stop the ref helper process, if one was started."""
+        async with self._ref_helper_lock:
+            await self._stop_ref_helper()
+
     def register(self, hooks):
         """Register this hook for provider:request events (fires right before LLM call)."""
         hooks.register(
@@ -189,23 +500,105 @@ class StatusContextHook:
         Returns:
             HookResult with context injection
         """
+        if not self._any_enabled:
+            return HookResult(action="continue")
+
+        # Back-to-back requests reuse the previous injection without any checks
+        if self._ctx_cache is not None:
+            _, created_at, cached_injection = self._ctx_cache
+            if time.monotonic() - created_at < self.min_refresh_interval:
+                return self._build_result(cached_injection)
+
+        # Reuse the previous injection while the repo is unchanged and it is fresh
+        cache_key = self._context_cache_key() if self.context_cache_ttl > 0 else None
+        if cache_key is not None and self._ctx_cache is not None:
+            cached_key, created_at, cached_injection = self._ctx_cache
+            if (
+                cached_key == cache_key
+                and time.monotonic() - created_at < self.context_cache_ttl
+            ):
+                return self._build_result(cached_injection)
+
         # Gather environment info (always shown)
         env_info = self._gather_env_info()
 
+        if self.split_volatile_context:
+            context_injection = await self._build_split_injection(env_info)
+        else:
+            context_injection = await self._build_injection(env_info)
+
+        if cache_key is not None or self.min_refresh_interval > 0:
+            self._ctx_cache = (cache_key, time.monotonic(), context_injection)
+
+        return self._build_result(context_injection)
+
+    async def _build_injection(self, env_info: EnvInfo) -> str:
+        """
+        Build the injection as a single system-reminder block.
+
+        Args:
+            env_info: Environment info for this request
+
+        Returns:
+            Context injection text
+        """
         # Gather git status details (only if repo detected and enabled)
         git_details = None
-        if self.include_git and env_info.get("is_git_repo"):
-            git_details = self._gather_git_context()
+        if self.include_git and env_info.is_git_repo:
+            git_details = await self._gather_git_context()
 
-        # Build context injection wrapped in system-reminder tags
-        context_parts = [env_info["formatted"]]
+        # Build context injection wrapped in system-reminder tags (one copy via join)
         if git_details:
-            context_parts.append(git_details)
+            return "".join(
+                (
+                    _REMINDER_OPEN,
+                    env_info.formatted,
+                    "\n\n",
+                    git_details,
+                    _REMINDER_CLOSE,
+                )
+            )
+        return "".join((_REMINDER_OPEN, env_info.formatted, _REMINDER_CLOSE))
+
+    async def _build_split_injection(self, env_info: EnvInfo) -> str:
+        """
+        Build the injection as a stable reminder block followed by a volatile one.
+
+        The first block holds environment info and branch/commit context, which rarely
+        change between turns; the date and working tree status go in the second.
+
+        Args:
+            env_info: Environment info gathered without the date line
 
-        context_content = "\n\n".join(context_parts)
-        behavioral_note = "\n\nThis context is for your reference only. DO NOT mention this status information to the user unless directly relevant to their question. Process silently and continue your work."
-        context_injection = f'<system-reminder source="hooks-status-context">\n{context_content}{behavioral_note}\n</system-reminder>'
+        Returns:
+            Two system-reminder blocks joined by a newline
+        """
+        sections = {}
+        if self.include_git and env_info.is_git_repo:
+            sections = await self._gather_git_sections()
+        status = sections.pop("status", None)
+
+        stable = env_info.formatted
+        if sections:
+            stable = "\n\n".join((stable, "\n".join((_GIT_PREAMBLE, *sections.values()))))
+        volatile = _ENV_DATE_BLOCK % env_info.date
+        if status:
+            volatile = "".join((volatile, status))
+
+        return "".join(
+            (
+                _REMINDER_OPEN,
+                stable,
+                _REMINDER_END,
+                "\n",
+                _REMINDER_OPEN,
+                volatile,
+                _REMINDER_CLOSE,
+            )
+        )
 
+    def _build_result(self, context_injection: str) -> HookResult:
+        """Wrap a context injection in the hook result."""
         return HookResult(
             action="inject_context",
             context_injection=context_injection,
@@ -214,33 +607,53 @@ class StatusContextHook:
             suppress_output=True,  # Don't show verbose status to user
         )
 
-    def _gather_env_info(self) -> dict[str, Any]:
-        """Gather environment information (working dir, platform, OS, date, session, git detection)."""
+    def _context_cache_key(self) -> tuple | None:
+        """
+        Build the injection cache key from the working dir and git metadata mtimes.
+
+        Staging, committing, and checkout all touch `.git/index` or `.git/HEAD`,
+        so two stat calls detect most changes without spawning git.
+
+        Returns:
+            Cache key, or None if the git metadata could not be read
+        """
+        cwd = self._resolved_cwd
+        # Detect first so the key never pairs this cwd with a previous repo's mtimes
+        if not self._detect_git_repo():
+            return (cwd, None, None)
         try:
-            # Get working directory (from config or current directory)
-            working_dir_path = Path(self.working_dir)
-            if not working_dir_path.is_absolute():
-                working_dir = str(Path.cwd() / working_dir_path)
-            else:
-                working_dir = str(working_dir_path)
+            git_dir = Path(self._git_dir)
+            head_mtime = os.stat(git_dir / "HEAD").st_mtime_ns
+        except OSError:
+            return None
+        try:
+            index_mtime = os.stat(git_dir / "index").st_mtime_ns
+        except OSError:
+            # Fresh repos have no index until the first `git add`
+            index_mtime = None
+        return (cwd, head_mtime, index_mtime)
 
-            # Detect if in git repo
-            is_git_repo = self._run_git(["rev-parse", "--git-dir"]) is not None
+    def _gather_env_info(self) -> EnvInfo:
+        """Gather environment information (working dir, platform, OS, date, session, git detection)."""
+        try:
+            # Get working directory (resolved from config at init)
+            working_dir = self._resolved_cwd
 
-            # Get platform info
-            platform_name = platform.system().lower()
+            # Detect if in git repo (keep the git dir for direct index reads)
+            is_git_repo = self._detect_git_repo()
 
-            # Get OS version
-            os_version = platform.platform()
+            # Platform info and OS version are fixed for the process
+            platform_name = _PLATFORM_NAME
+            os_version = _OS_VERSION
 
             # Get current date (with optional time)
             now = datetime.now()
             if self.include_datetime:
                 if self.datetime_include_timezone:
-                    timezone_name = now.astimezone().tzname()
-                    date_str = f"{now.strftime('%Y-%m-%d %H:%M:%S')} {timezone_name}"
+                    timezone_name = _LOCAL_TZNAMES[time.localtime().tm_isdst > 0]
+                    date_str = f"{now.strftime(self._time_format)} {timezone_name}"
                 else:
-                    date_str = f"{now.strftime('%Y-%m-%d %H:%M:%S')}"
+                    date_str = now.strftime(self._time_format)
             else:
                 date_str = now.strftime("%Y-%m-%d")
 
@@ -256,283 +669,763 @@ class StatusContextHook:
                 except Exception as e:
                     logger.debug(f"Could not get session info: {e}")
 
-            # Format the env block
-            env_lines = [
-                "Here is useful information about the environment you are running in:",
-                "<env>",
-                f"Working directory: {working_dir}",
-            ]
-
-            # Add session info if available
-            if self.include_session and session_id:
-                env_lines.append(f"Session ID: {session_id}")
+            # Optional blocks are pre-formatted, then the template is applied once
+            session_block = ""
+            if session_id:
                 if is_sub_session:
-                    env_lines.append(f"Parent Session ID: {parent_session_id}")
-                    env_lines.append("Is sub-session: Yes")
+                    session_block = _ENV_SUB_SESSION_BLOCK % (session_id, parent_session_id)
                 else:
-                    env_lines.append("Is sub-session: No")
+                    session_block = _ENV_SESSION_BLOCK % session_id
 
-            # Add loaded bundles info if available
+            bundles_block = ""
             if self.include_bundles:
                 bundle_names = self._gather_loaded_bundles()
                 if bundle_names:
-                    env_lines.append(f"Loaded bundles: {', '.join(bundle_names)}")
-
-            env_lines.extend(
-                [
-                    f"Is directory a git repo: {'Yes' if is_git_repo else 'No'}",
-                    f"Platform: {platform_name}",
-                    f"OS Version: {os_version}",
-                    f"Today's date: {date_str}",
-                    "</env>",
-                ]
-            )
-
-            formatted = "\n".join(env_lines)
+                    bundles_block = _ENV_BUNDLES_BLOCK % ", ".join(bundle_names)
 
-            return {
+            formatted = _ENV_TEMPLATE % {
                 "working_dir": working_dir,
-                "is_git_repo": is_git_repo,
+                "session_block": session_block,
+                "bundles_block": bundles_block,
+                "is_git_repo": "Yes" if is_git_repo else "No",
                 "platform": platform_name,
                 "os_version": os_version,
-                "date": date_str,
-                "session_id": session_id,
-                "parent_session_id": parent_session_id,
-                "is_sub_session": is_sub_session,
-                "formatted": formatted,
+                "date_block": "" if self.split_volatile_context else _ENV_DATE_BLOCK % date_str,
             }
 
+            return EnvInfo(
+                working_dir=working_dir,
+                is_git_repo=is_git_repo,
+                platform=platform_name,
+                os_version=os_version,
+                date=date_str,
+                session_id=session_id,
+                parent_session_id=parent_session_id,
+                is_sub_session=is_sub_session,
+                formatted=formatted,
+            )
+
         except Exception as e:
             logger.warning(f"Failed to gather environment info: {e}")
             # Return minimal info on failure with configured working_dir
-            working_dir_path = Path(self.working_dir)
-            if not working_dir_path.is_absolute():
-                fallback_dir = str(Path.cwd() / working_dir_path)
-            else:
-                fallback_dir = str(working_dir_path)
-            return {
-                "working_dir": fallback_dir,
-                "is_git_repo": False,
-                "platform": "unknown",
-                "os_version": "unknown",
-                "date": datetime.now().strftime("%Y-%m-%d"),
-                "session_id": None,
-                "parent_session_id": None,
-                "is_sub_session": False,
-                "formatted": "Here is useful information about the environment you are running in:\n<env>\nEnvironment information unavailable\n</env>",
-            }
+            return EnvInfo(
+                working_dir=self._resolved_cwd,
+                is_git_repo=False,
+                platform="unknown",
+                os_version="unknown",
+                date=datetime.now().strftime("%Y-%m-%d"),
+                session_id=None,
+                parent_session_id=None,
+                is_sub_session=False,
+                formatted=_ENV_UNAVAILABLE,
+            )
+
+    def _detect_git_repo(self) -> bool:
+        """
+        Detect whether the working directory is inside a git repository.
+
+        Uses GIT_DIR when set, otherwise walks up from the working directory looking
+        for `.git`, instead of spawning `git rev-parse`; the result is cached per
+        resolved working directory. A
+        cached git dir is revalidated with one stat, and a cached miss is re-walked
+        (without rev-parse) so a later `git init` is picked up.
+
+        Returns:
+            True if a git dir was found and git is installed (git dir also stored
+            on self._git_dir)
+        """
+        if self._git_exe is None:
+            # Without git there is no status to show, so report no repo at all
+            self._git_dir = None
+            return False
+        cwd = self._resolved_cwd
+        if cwd not in self._git_dir_cache:
+            git_dir = self._locate_git_dir(cwd)
+            if git_dir is None and self.git_detect_use_rev_parse:
+                # Bare repos and other layouts only git itself understands
+                git_dir = self._run_git(["rev-parse", "--absolute-git-dir"])
+            self._git_dir_cache[cwd] = git_dir
+        else:
+            git_dir = self._git_dir_cache[cwd]
+            if git_dir is None or not os.path.isdir(git_dir):
+                git_dir = self._git_dir_cache[cwd] = self._locate_git_dir(cwd)
+        self._git_dir = git_dir
+        return self._git_dir is not None
+
+    def _locate_git_dir(self, cwd: str) -> str | None:
+        """
+        Find the git dir the git subprocesses will use for cwd.
+
+        GIT_DIR is kept in the subprocess environment, so when set it names the
+        repository instead of any `.git` found above the working directory.
 
-    def _gather_loaded_bundles(self) -> list[str]:
+        Args:
+            cwd: Absolute working directory
+
+        Returns:
+            Absolute git dir path, or None if not found
         """
-        Gather list of loaded bundle names from the mention resolver.
+        env_git_dir = self._git_env.get("GIT_DIR")
+        if env_git_dir:
+            # Relative values resolve against -C, which is the working directory
+            git_dir = os.path.abspath(os.path.join(cwd, env_git_dir))
+            return git_dir if os.path.isfile(os.path.join(git_dir, "HEAD")) else None
+        return self._find_git_dir(Path(cwd))
+
+    @staticmethod
+    def _find_git_dir(start: Path, max_depth: int = 20) -> str | None:
+        """
+        Find the git dir for start by checking it and its parents for `.git`.
+
+        Args:
+            start: Absolute directory to start from
+            max_depth: Maximum number of directories to check
 
         Returns:
-            Sorted list of bundle names, or empty list if unavailable.
+            Absolute git dir path, or None if not found
+        """
+        for directory in [start, *start.parents][:max_depth]:
+            dot_git = directory / ".git"
+            if os.path.isfile(dot_git / "HEAD"):
+                return str(dot_git)
+            if os.path.isfile(dot_git):
+                # Worktrees and submodules use a "gitdir: <path>" pointer file
+                try:
+                    pointer = dot_git.read_text(encoding="utf-8").strip()
+                except OSError:
+                    return None
+                if not pointer.startswith("gitdir: "):
+                    return None
+                return str((directory / pointer[len("gitdir: ") :]).resolve())
+        return None
+
+    def _gather_loaded_bundles(self) -> tuple[str, ...]:
+        """
+        Gather loaded bundle names from the mention resolver.
+
+        Bundles rarely change after startup, so the sorted names are snapshotted
+        and only re-sorted when the mapping object or its size changes.
+
+        Returns:
+            Sorted tuple of bundle names, or empty tuple if unavailable.
         """
         try:
             mention_resolver = self.coordinator.get_capability("mention_resolver")
             if mention_resolver and hasattr(mention_resolver, "_bundle_mappings"):
-                return sorted(mention_resolver._bundle_mappings.keys())
+                mappings = mention_resolver._bundle_mappings
+                key = (id(mappings), len(mappings))
+                if self._bundles_snapshot is None or self._bundles_snapshot[0] != key:
+                    self._bundles_snapshot = (key, tuple(sorted(mappings)))
+                return self._bundles_snapshot[1]
         except Exception as e:
             logger.debug(f"Could not get loaded bundles: {e}")
-        return []
+        return ()
+
+    async def _gather_git_context(self) -> str | None:
+        """
+        Gather current git repository context (assumes already detected as git repo).
+
+        Returns:
+            The gitStatus block, or None if no section could be gathered
+        """
+        sections = await self._gather_git_sections()
+        if not sections:
+            return None
+        return "\n".join((_GIT_PREAMBLE, *sections.values()))
+
+    async def _gather_git_sections(self) -> dict[str, str]:
+        """
+        Gather the enabled git sections, keyed "branch", "main_branch", "status", "log".
 
-    def _gather_git_context(self) -> str | None:
-        """Gather current git repository context (assumes already detected as git repo)."""
+        Status (with its branch header), commit log, and main branch detection are
+        independent, so they run as concurrent subprocesses.
+
+        Returns:
+            Formatted sections in display order (empty on failure)
+        """
         try:
-            parts = [
-                "gitStatus: This is the git status at the start of the conversation. "
-                "Note that this status is a snapshot in time, and will not update during the conversation."
-            ]
+            sections = {}
+
+            # Queue independent git queries; `status --branch` also yields the branch name
+            pending = {}
+            if self.git_include_status:
+                pending["status"] = self._git_status_cached()
+            elif self.git_include_branch:
+                pending["branch"] = self._current_branch()
+            if self.git_include_main_branch:
+                pending["main_branch"] = self._detect_main_branch()
+            if self.git_include_commits and self.git_include_commits > 0:
+                pending["log"] = self._git_log()
+            # A failed query only affects its own section
+            results = {
+                name: None if isinstance(result, BaseException) else result
+                for name, result in zip(
+                    pending,
+                    await asyncio.gather(*pending.values(), return_exceptions=True),
+                )
+            }
+
+            branch = results.get("branch")
+            # A failed status must not read as a clean tree
+            status = _STATUS_UNAVAILABLE
+            if results.get("status") is not None:
+                branch, status = results["status"]
+            elif self.git_include_status and self.git_include_branch:
+                # Status failed or timed out; HEAD still names the branch
+                branch = await self._current_branch()
 
             # Current branch
-            if self.git_include_branch:
-                branch = self._run_git(["branch", "--show-current"])
-                if branch:
-                    parts.append(f"Current branch: {branch}")
+            if self.git_include_branch and branch:
+                sections["branch"] = f"Current branch: {branch}"
 
             # Main branch detection
-            if self.git_include_main_branch:
-                for main_branch in ["main", "master"]:
-                    result = self._run_git(["rev-parse", "--verify", main_branch])
-                    if result is not None:
-                        parts.append(
-                            f"\nMain branch (you will usually use this for PRs): {main_branch}"
-                        )
-                        break
+            main_branch = results.get("main_branch")
+            if main_branch:
+                sections["main_branch"] = (
+                    f"\nMain branch (you will usually use this for PRs): {main_branch}"
+                )
 
             # Working directory status
             if self.git_include_status:
-                status = self._gather_git_status()
                 if status:
-                    parts.append(f"\nStatus:\n{status}")
+                    sections["status"] = f"\nStatus:\n{status}"
 
             # Recent commits
-            if self.git_include_commits and self.git_include_commits > 0:
-                log = self._run_git(
-                    ["log", "--oneline", f"-{self.git_include_commits}"]
-                )
-                if log:
-                    parts.append(f"\nRecent commits:\n{log}")
+            log = results.get("log")
+            if log:
+                sections["log"] = f"\nRecent commits:\n{log}"
 
-            return "\n".join(parts) if len(parts) > 1 else None
+            return sections
 
         except Exception as e:
             logger.warning(f"Failed to gather git context: {e}")
+            return {}
+
+    async def _detect_main_branch(self) -> str | None:
+        """
+        Detect whether "main" or "master" exists.
+
+        Memoized per working directory until a branch is created, deleted, or
+        packed, which is seen as an mtime change on refs/heads or packed-refs.
+        """
+        cwd = self._resolved_cwd
+        validator = self._metadata_mtimes(
+            self._git_common_dir(), ("refs/heads", "packed-refs")
+        )
+        cached = self._main_branch_cache.get(cwd)
+        if cached is not None and cached[0] == validator:
+            return cached[1]
+
+        # Loose and packed refs answer directly; git is only needed for other ref
+        # backends. One process lists whichever candidates exist (patterns also
+        # match "main/..." branches, so compare exact names)
+        candidates = ("main", "master")
+        refs = [f"refs/heads/{candidate}" for candidate in candidates]
+        found = self._read_refs_exist(refs)
+        if found is None and self.git_ref_helper:
+            found = await self._query_ref_helper(refs)
+        if found is not None:
+            existing = {c for c, exists in zip(candidates, found) if exists}
+        else:
+            output = await self._run_git_async(
+                ["for-each-ref", "--format=%(refname:short)"] + refs
+            )
+            existing = set(output.splitlines()) if output else set()
+        main_branch = next((c for c in candidates if c in existing), None)
+
+        self._main_branch_cache[cwd] = (validator, main_branch)
+        return main_branch
+
+    async def _current_branch(self) -> str | None:
+        """Get the current branch from HEAD, asking git only if HEAD cannot be read."""
+        resolved, branch = self._read_head_branch()
+        if resolved:
+            return branch
+        return await self._run_git_async(["branch", "--show-current"])
+
+    def _read_head_branch(self) -> tuple[bool, str | None]:
+        """
+        Read the current branch straight from the HEAD file.
+
+        Returns:
+            Tuple of (resolved, branch); branch is None when HEAD is detached, and
+            resolved is False when git must be asked (e.g., the reftable backend)
+        """
+        if not self._git_dir:
+            return False, None
+        try:
+            with open(os.path.join(self._git_dir, "HEAD"), encoding="utf-8") as head_file:
+                head = head_file.read().strip()
+        except OSError:
+            return False, None
+        if not head.startswith("ref: "):
+            # A bare object id means a detached HEAD
+            return True, None
+        ref = head[len("ref: ") :]
+        if not ref.startswith("refs/heads/") or ref == "refs/heads/.invalid":
+            # reftable repos keep a placeholder HEAD
+            return False, None
+        return True, ref[len("refs/heads/") :]
+
+    def _read_refs_exist(self, refs: list[str]) -> list[bool] | None:
+        """
+        Check which refs exist by reading loose ref files and packed-refs.
+
+        Args:
+            refs: Full ref names (e.g., "refs/heads/main")
+
+        Returns:
+            Whether each ref exists, or None if the repo uses another ref backend
+        """
+        common_dir = self._git_common_dir()
+        if not common_dir or os.path.isdir(os.path.join(common_dir, "reftable")):
             return None
+        found = [os.path.isfile(os.path.join(common_dir, ref)) for ref in refs]
+        if all(found):
+            return found
+        try:
+            with open(os.path.join(common_dir, "packed-refs"), encoding="utf-8") as packed:
+                # "<oid> <refname>" lines; "#" headers and "^" peeled lines never match
+                packed_refs = {line.rstrip("\n").partition(" ")[2] for line in packed}
+        except FileNotFoundError:
+            return found
+        except OSError:
+            return None
+        return [exists or ref in packed_refs for exists, ref in zip(found, refs)]
+
+    async def _query_ref_helper(
+        self, refs: list[str], timeout: float = 1.0
+    ) -> list[bool] | None:
+        """
+        Check which refs exist using the long-lived ref helper process.
 
-    def _matches_tier(self, filepath: str, patterns: list[str]) -> bool:
-        """Check if filepath matches any pattern in the list.
+        The helper is started on first use (and restarted after a working
+        directory change or failure), so lookups skip git's process startup.
 
         Args:
-            filepath: File path to check
-            patterns: List of glob patterns to match against
+            refs: Full ref names without spaces (e.g., "refs/heads/main")
+            timeout: Seconds to wait for all answers
 
         Returns:
-            True if filepath matches any pattern
+            Whether each ref exists, or None if the helper failed
+        """
+        async with self._ref_helper_lock:
+            try:
+                helper = self._ref_helper
+                if (
+                    helper is None
+                    or helper.returncode is not None
+                    or self._ref_helper_cwd != self._resolved_cwd
+                ):
+                    await self._stop_ref_helper()
+                    if self._git_exe is None:
+                        raise FileNotFoundError("git not found on PATH")
+                    helper = self._ref_helper = await asyncio.create_subprocess_exec(
+                        *self._git_argv(["cat-file", "--batch-check=%(objectname)"]),
+                        stdin=asyncio.subprocess.PIPE,
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.DEVNULL,
+                        # Long-lived, so it keeps the default close_fds=True: fds
+                        # made inheritable later must not stay open in the helper
+                        env=self._git_env,
+                    )
+                    self._ref_helper_cwd = self._resolved_cwd
+
+                helper.stdin.write("".join(f"{ref}\n" for ref in refs).encode("utf-8"))
+                await helper.stdin.drain()
+
+                async def read_answers() -> list[bytes]:
+                    return [await helper.stdout.readline() for _ in refs]
+
+                answers = await asyncio.wait_for(read_answers(), timeout=timeout)
+                if not all(answers):
+                    raise EOFError("ref helper exited")
+                # Found refs print only the object name; others print "<ref> missing"
+                return [b" " not in answer.strip() for answer in answers]
+            except Exception as e:
+                logger.debug(f"Ref helper failed: {e}")
+                await self._stop_ref_helper()
+                return None
+
+    async def _stop_ref_helper(self) -> None:
+        """Kill the ref helper process (callers hold the helper lock)."""
+        helper, self._ref_helper = self._ref_helper, None
+        if helper is not None and helper.returncode is None:
+            helper.kill()
+            await helper.wait()
+
+    async def _git_log(self) -> str | None:
+        """
+        Get the recent commit log, reused while HEAD has not moved.
+
+        Every commit, checkout, reset, or rebase appends to the HEAD reflog, so its
+        mtime (with HEAD and the index) validates the cached log. Without a reflog
+        the log is not cached.
+        """
+        cwd = self._resolved_cwd
+        validator = self._metadata_mtimes(self._git_dir, ("HEAD", "logs/HEAD", "index"))
+        cacheable = validator[1] is not None
+        cached = self._log_cache.get(cwd)
+        if cacheable and cached is not None and cached[0] == validator:
+            return cached[1]
+
+        # Same lines as --oneline, but without config-dependent decoration and color
+        log = await self._run_git_async(
+            [
+                "log",
+                "-n",
+                str(self.git_include_commits),
+                "--no-color",
+                "--no-decorate",
+                "--format=%h %s",
+            ]
+        )
+        if cacheable and log is not None:
+            self._log_cache[cwd] = (validator, log)
+        return log
+
+    def _git_common_dir(self) -> str | None:
+        """Return the dir holding shared refs (differs from the git dir in linked worktrees)."""
+        if not self._git_dir:
+            return None
+        env_common_dir = self._git_env.get("GIT_COMMON_DIR")
+        if env_common_dir:
+            return os.path.abspath(os.path.join(self._resolved_cwd, env_common_dir))
+        try:
+            common = (Path(self._git_dir) / "commondir").read_text(encoding="utf-8").strip()
+        except OSError:
+            return self._git_dir
+        return str(Path(self._git_dir) / common)
+
+    @staticmethod
+    def _metadata_mtimes(base: str | None, names: tuple[str, ...]) -> tuple:
         """
-        import fnmatch
+        Stat git metadata files for cache validation.
 
-        for pattern in patterns:
-            # Handle directory patterns (ends with /**)
-            if pattern.endswith("/**"):
-                prefix = pattern[:-3]  # Remove /**
-                if filepath.startswith(prefix):
-                    return True
-            # Handle glob patterns
-            elif fnmatch.fnmatch(filepath, pattern):
-                return True
-        return False
+        Args:
+            base: Directory the names are relative to, or None outside a repo
+            names: Relative paths to stat
 
-    def _classify_status_line(self, line: str) -> tuple[str, str, str]:
-        """Classify git status line into tier.
+        Returns:
+            Tuple of st_mtime_ns per name, with None for missing files
+        """
+        mtimes = []
+        for name in names:
+            try:
+                mtimes.append(os.stat(os.path.join(base, name)).st_mtime_ns if base else None)
+            except OSError:
+                mtimes.append(None)
+        return tuple(mtimes)
+
+    def _matches_tier(
+        self,
+        filepath: str,
+        matcher: tuple[tuple[str, ...], re.Pattern[str] | None],
+    ) -> bool:
+        """Check if filepath matches a compiled tier.
 
         Args:
-            line: Git status line in --short format (e.g., "M  file.py" or "?? dir/file.js")
+            filepath: File path to check
+            matcher: Compiled tier from _compile_tier_patterns
 
         Returns:
-            Tuple of (tier, filepath, status_code)
-            - tier: "tier1", "tier2", or "tier3"
-            - filepath: The file path from the status line
-            - status_code: The git status code (e.g., "M", "A", "??")
+            True if filepath matches any pattern in the tier
         """
-        # Parse git status --short format: "XY filepath"
-        # Status codes are 2 characters, followed by space
-        status_code = line[:2].strip()
-        filepath = line[3:].strip() if len(line) > 3 else ""
+        prefixes, regex = matcher
+        # Directory patterns (ends with /**) are checked in one C-level call
+        if filepath.startswith(prefixes):
+            return True
+        # All glob patterns share a single compiled regex
+        return regex is not None and regex.match(filepath) is not None
 
+    def _classify_path(self, filepath: str, tier1_paths: set[str] | None = None) -> str:
+        """Classify a status path into a tier.
+
+        Args:
+            filepath: File path from a git status line
+            tier1_paths: Paths already matched by `git check-ignore`, if used
+
+        Returns:
+            "tier1", "tier2", or "tier3"
+        """
         if not self.git_status_enable_path_filtering:
-            return ("tier3", filepath, status_code)
+            return "tier3"
 
         # Check tier 1 (always ignore)
-        if self._matches_tier(filepath, self.tier1_patterns):
-            return ("tier1", filepath, status_code)
+        if tier1_paths is not None:
+            if filepath in tier1_paths:
+                return "tier1"
+        elif self._matches_tier(filepath, self._tier1_matcher):
+            return "tier1"
 
         # Check tier 2 (limit with context)
-        if self._matches_tier(filepath, self.tier2_patterns):
-            return ("tier2", filepath, status_code)
+        if self._matches_tier(filepath, self._tier2_matcher):
+            return "tier2"
 
         # Everything else is tier 3 (show)
-        return ("tier3", filepath, status_code)
+        return "tier3"
+
+    def _git_status_args(self, scan_untracked: bool | None = None) -> list[str]:
+        """
+        Build `git status` arguments that avoid scans whose output would be discarded.
+
+        Untracked files are only enumerated when they will be shown (and never
+        recursed into untracked directories), and submodules are skipped unless
+        explicitly requested.
+
+        Args:
+            scan_untracked: Whether to scan untracked files, or None to decide here
 
-    def _gather_git_status(self) -> str | None:
+        Returns:
+            Arguments for `git status --porcelain=v2 -z`
+        """
+        if scan_untracked is None:
+            scan_untracked = (
+                self.git_status_include_untracked
+                and self._untracked_skipped_entries() is None
+            )
+
+        args = [
+            "status",
+            "--porcelain=v2",
+            "-z",
+            f"--untracked-files={'normal' if scan_untracked else 'no'}",
+        ]
+        if self.git_status_ignore_submodules:
+            args.append("--ignore-submodules=all")
+        return args
+
+    def _untracked_skipped_entries(self) -> int | None:
+        """
+        Check whether the untracked scan is skipped by git_status_uno_threshold.
+
+        Returns:
+            Number of index entries when it exceeds the threshold, otherwise None
+        """
+        if not self.git_status_include_untracked or not self.git_status_uno_threshold:
+            return None
+        index_entries = self._index_entry_count()
+        if index_entries is None or index_entries <= self.git_status_uno_threshold:
+            return None
+        logger.debug(f"Index has {index_entries} entries, skipping untracked file scan")
+        return index_entries
+
+    def _index_entry_count(self) -> int | None:
+        """Read the number of index entries from the git index header."""
+        if not self._git_dir:
+            return None
+        try:
+            with open(Path(self._git_dir) / "index", "rb") as index_file:
+                header = index_file.read(12)
+        except OSError:
+            return None
+        # Header layout: "DIRC" signature, 4-byte version, 4-byte entry count
+        if len(header) < 12 or header[:4] != b"DIRC":
+            return None
+        return int.from_bytes(header[8:12], "big")
+
+    async def _git_status_cached(self) -> tuple[str | None, str]:
+        """
+        Get the streamed git status, reused while nothing visible to stat changed.
+
+        Staging touches the index and creating, deleting, or renaming an entry
+        touches its parent directory. Only the index and the worktree root and its
+        top-level directories are checked, so those changes are seen just at the top
+        level: creating src/pkg/new.py, or editing any existing file in place, is
+        not. Reuse is therefore also bounded by git_status_cache_ttl.
+
+        Returns:
+            Tuple of (current branch or None, formatted git status output)
+        """
+        if self.git_status_cache_ttl <= 0:
+            return await self._stream_git_status()
+
+        fingerprint = self._worktree_fingerprint()
+        key = None
+        if fingerprint is not None:
+            key = (
+                self._resolved_cwd,
+                self._metadata_mtimes(self._git_dir, ("HEAD", "index")),
+                fingerprint,
+            )
+        if key is not None and self._status_cache is not None:
+            cached_key, created_at, cached_status = self._status_cache
+            if (
+                cached_key == key
+                and time.monotonic() - created_at < self.git_status_cache_ttl
+            ):
+                return cached_status
+
+        status = await self._stream_git_status()
+        if key is not None:
+            self._status_cache = (key, time.monotonic(), status)
+        return status
+
+    def _worktree_fingerprint(self) -> tuple | None:
         """
-        Get git status with tier-based path filtering.
+        Collect mtimes of the worktree root and its top-level directories.
+
+        Returns:
+            Tuple of (name, st_mtime_ns) pairs, or None if the worktree can't be read
+        """
+        if not self._git_dir:
+            return None
+        # A ".git" dir sits in the worktree root; linked worktrees fall back to cwd
+        work_tree = self._git_env.get("GIT_WORK_TREE")
+        if work_tree:
+            root = os.path.abspath(os.path.join(self._resolved_cwd, work_tree))
+        elif os.path.basename(self._git_dir) == ".git":
+            root = os.path.dirname(self._git_dir)
+        else:
+            root = self._resolved_cwd
+        try:
+            mtimes = [("", os.stat(root).st_mtime_ns)]
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if entry.name != ".git" and entry.is_dir(follow_symlinks=False):
+                        mtime = entry.stat(follow_symlinks=False).st_mtime_ns
+                        mtimes.append((entry.name, mtime))
+        except OSError:
+            return None
+        return tuple(mtimes)
+
+    async def _stream_git_status(self) -> tuple[str | None, str]:
+        """
+        Run `git status --branch` and bucket its records as stdout arrives.
 
         Three-tier classification system:
         - Tier 1 (Always Ignore): node_modules/, .venv/, build/, etc. - Even if tracked
         - Tier 2 (Limit with Context): *.lock, .vscode/, *.log, etc. - Show some, summarize rest
         - Tier 3 (Always Show): Source code and important files
 
+        Only capped lines and counters are held, so memory stays bounded however
+        many files are dirty. Git is left to finish so omitted counts stay exact.
+
         Returns:
-            Formatted git status output with tier-based filtering applied
+            Tuple of (current branch or None, formatted git status output)
         """
-        raw_status = self._run_git(["status", "--short"])
-        if not raw_status:
-            return "Working directory clean"
-
-        # Classify all lines into tiers
-        tier1_tracked = []
-        tier1_untracked = []
-        tier2_lines = []
-        tier3_tracked = []
-        tier3_untracked = []
+        parser = _PorcelainV2Parser()
+        buckets = self._new_status_buckets()
+        buckets.untracked_skipped_entries = self._untracked_skipped_entries()
+        args = self._git_status_args(
+            scan_untracked=self.git_status_include_untracked
+            and buckets.untracked_skipped_entries is None
+        )
+        carry = b""
+        async for chunk in self._stream_git_async(args + ["--branch"]):
+            *records, carry = (carry + chunk).split(b"\0")
+            await self._bucket_status_async(
+                buckets, parser.feed(r.decode("utf-8", "replace") for r in records)
+            )
+        if carry:
+            await self._bucket_status_async(
+                buckets, parser.feed([carry.decode("utf-8", "replace")])
+            )
+        return parser.branch, self._render_status(buckets)
+
+    async def _bucket_status_async(
+        self, buckets: _StatusBuckets, entries: Iterable[tuple[str, str, str]]
+    ) -> None:
+        """Classify a batch of parsed entries into buckets, awaiting check-ignore."""
+        tier1_paths = None
+        if self._uses_check_ignore:
+            entries = list(entries)
+            tier1_paths = await self._check_ignore_tier1(
+                [path for _, _, path in entries]
+            )
+        self._bucket_status(buckets, entries, tier1_paths)
+
+    def _new_status_buckets(self) -> _StatusBuckets:
+        """Create empty status buckets sized by the configured display caps."""
+        return _StatusBuckets(
+            max_tracked=self.git_status_max_tracked,
+            max_untracked=self.git_status_max_untracked,
+            tier2_limit=self.git_status_tier2_limit,
+            include_untracked=self.git_status_include_untracked,
+        )
 
-        for line in raw_status.splitlines():
-            tier, filepath, status = self._classify_status_line(line)
+    def _bucket_status(
+        self,
+        buckets: _StatusBuckets,
+        entries: Iterable[tuple[str, str, str]],
+        tier1_paths: set[str] | None = None,
+    ) -> None:
+        """Classify parsed status entries into buckets."""
+        for tier, status, line in self._iter_classified_status(entries, tier1_paths):
+            buckets.add(tier, status, line)
+
+    @property
+    def _uses_check_ignore(self) -> bool:
+        """Whether Tier 1 is matched with `git check-ignore` batches."""
+        return bool(self._tier1_excludes_file) and self.git_status_enable_path_filtering
+
+    def _render_status(self, buckets: _StatusBuckets) -> str:
+        """
+        Render bucketed status lines with filter summaries and the hard line limit.
 
-            if tier == "tier1":
-                if status == "??":
-                    tier1_untracked.append(line)
-                else:
-                    tier1_tracked.append(line)
-            elif tier == "tier2":
-                tier2_lines.append(line)
-            else:  # tier3
-                if status == "??":
-                    tier3_untracked.append(line)
-                else:
-                    tier3_tracked.append(line)
+        Args:
+            buckets: Status buckets filled by `_bucket_status`
 
-        # Build output
+        Returns:
+            Formatted git status output
+        """
         result = []
 
         # Tier 3 tracked: Apply tracked limit
-        if len(tier3_tracked) <= self.git_status_max_tracked:
-            result.extend(tier3_tracked)
-        else:
-            result.extend(tier3_tracked[: self.git_status_max_tracked])
-            omitted = len(tier3_tracked) - self.git_status_max_tracked
-            if self.git_status_show_filter_summary:
-                result.append(f"... ({omitted} more tracked files omitted)")
-
-        # Tier 3 untracked: Apply untracked limit (existing logic)
-        if self.git_status_include_untracked:
-            if len(tier3_untracked) <= self.git_status_max_untracked:
-                result.extend(tier3_untracked)
-            else:
-                result.extend(tier3_untracked[: self.git_status_max_untracked])
-                omitted = len(tier3_untracked) - self.git_status_max_untracked
-                if self.git_status_show_filter_summary:
-                    result.append(f"... ({omitted} more untracked files omitted)")
+        result.extend(buckets.tier3_tracked)
+        omitted = buckets.tier3_tracked_count - len(buckets.tier3_tracked)
+        if omitted and self.git_status_show_filter_summary:
+            result.append(f"... ({omitted} more tracked files omitted)")
+
+        # Tier 3 untracked: Apply untracked limit
+        result.extend(buckets.tier3_untracked)
+        omitted = buckets.tier3_untracked_count - len(buckets.tier3_untracked)
+        if omitted and self.git_status_show_filter_summary:
+            result.append(f"... ({omitted} more untracked files omitted)")
 
         # Tier 2: Limited display
-        if len(tier2_lines) <= self.git_status_tier2_limit:
-            result.extend(tier2_lines)
-        else:
-            result.extend(tier2_lines[: self.git_status_tier2_limit])
-            omitted = len(tier2_lines) - self.git_status_tier2_limit
-            if self.git_status_show_filter_summary:
-                result.append(f"... ({omitted} more support files omitted)")
+        result.extend(buckets.tier2_lines)
+        omitted = buckets.tier2_count - len(buckets.tier2_lines)
+        if omitted and self.git_status_show_filter_summary:
+            result.append(f"... ({omitted} more support files omitted)")
+
+        tier1_tracked_count = buckets.tier1_tracked_count
+        tier1_untracked_count = buckets.tier1_untracked_count
 
         # Add blank line before summaries if we showed files
         if (
             result
             and self.git_status_show_filter_summary
-            and (tier1_tracked or tier1_untracked)
+            and (tier1_tracked_count or tier1_untracked_count)
         ):
             result.append("")
 
         # Tier 1 summaries with explicit messages
         if self.git_status_show_filter_summary:
-            if tier1_tracked:
+            if tier1_tracked_count:
                 # WARNING: Tracked files in ignored paths
                 result.append(
-                    f"[WARNING: {len(tier1_tracked)} tracked files in ignored paths]"
+                    f"[WARNING: {tier1_tracked_count} tracked files in ignored paths]"
                 )
                 # Show examples
-                examples = tier1_tracked[:3]
-                for ex in examples:
+                for ex in buckets.tier1_tracked_examples:
                     result.append(f"  {ex}")
-                if len(tier1_tracked) > 3:
-                    result.append(f"  ... and {len(tier1_tracked) - 3} more")
+                if tier1_tracked_count > 3:
+                    result.append(f"  ... and {tier1_tracked_count - 3} more")
                 result.append("[Suggestion: These directories should not be tracked]")
 
-            if tier1_untracked:
+            if tier1_untracked_count:
                 result.append(
-                    f"[Filtered: {len(tier1_untracked)} untracked files in ignored paths]"
+                    f"[Filtered: {tier1_untracked_count} untracked files in ignored paths]"
                 )
 
+        # A skipped scan must not read as a clean tree
+        if buckets.untracked_skipped_entries is not None:
+            result.append(
+                "(untracked files not scanned: index has "
+                f"{buckets.untracked_skipped_entries} entries)"
+            )
+
         # Apply absolute hard limit (safety backstop)
         if len(result) > self.git_status_max_lines:
             result = result[: self.git_status_max_lines]
@@ -542,25 +1435,212 @@ class StatusContextHook:
 
         return "\n".join(result) if result else "Working directory clean"
 
+    def _iter_classified_status(
+        self,
+        entries: Iterable[tuple[str, str, str]],
+        tier1_paths: set[str] | None = None,
+    ) -> Iterator[tuple[str, str, str]]:
+        """
+        Lazily classify parsed status entries.
+
+        Args:
+            entries: Tuples of (line, status_code, filepath) from the status parser
+            tier1_paths: Tier 1 paths from `git check-ignore`, or None to use patterns
+
+        Yields:
+            Tuple of (tier, status_code, line)
+        """
+        if not self.git_status_enable_path_filtering:
+            # Decided once for the whole batch rather than per line
+            for line, status, _ in entries:
+                yield "tier3", status, line
+            return
+
+        for line, status, filepath in entries:
+            yield self._classify_path(filepath, tier1_paths), status, line
+
+    def _write_tier1_excludes_file(self) -> str | None:
+        """Write Tier 1 patterns to a temp gitignore-style file for `git check-ignore`."""
+        try:
+            fd, path = tempfile.mkstemp(prefix="hooks-status-context-", suffix=".ignore")
+            with os.fdopen(fd, "w", encoding="utf-8") as excludes:
+                excludes.write("\n".join(self.tier1_patterns) + "\n")
+        except OSError as e:
+            logger.debug(f"Could not write Tier 1 excludes file: {e}")
+            return None
+        weakref.finalize(self, _unlink_quietly, path)
+        return path
+
+    async def _check_ignore_tier1(self, paths: list[str]) -> set[str] | None:
+        """
+        Match status paths against Tier 1 patterns with one `git check-ignore` call.
+
+        The streaming status path calls this once per stdout chunk (64 KiB of
+        records), so memory stays bounded at the cost of one spawn per chunk.
+
+        Args:
+            paths: File paths from git status lines
+
+        Returns:
+            Set of Tier 1 paths, or None to fall back to the regex matcher
+        """
+        if not paths:
+            return set()
+        # Status paths are relative to the repo root, so run from there
+        cwd = self._resolved_cwd
+        if cwd not in self._show_cdup_cache:
+            show_cdup = await self._run_git_async(["rev-parse", "--show-cdup"])
+            if show_cdup is None:
+                return None
+            self._show_cdup_cache[cwd] = show_cdup
+        output = await self._run_git_async(
+            self._check_ignore_args(self._show_cdup_cache[cwd]),
+            input="\0".join(paths) + "\0",
+            ok_returncodes=(0, 1),  # 1 = nothing matched
+        )
+        return self._parse_check_ignore(output)
+
+    def _check_ignore_args(self, show_cdup: str) -> list[str]:
+        """Build `git check-ignore` arguments that read NUL-separated paths from stdin."""
+        return [
+            "-C",
+            show_cdup,
+            "-c",
+            f"core.excludesFile={self._tier1_excludes_file}",
+            "check-ignore",
+            "--no-index",
+            "--stdin",
+            "-z",
+            "--verbose",
+        ]
+
+    def _parse_check_ignore(self, output: str | None) -> set[str] | None:
+        """
+        Collect Tier 1 paths from `git check-ignore -z --verbose` output.
+
+        In-tree .gitignore rules take precedence over core.excludesFile, so a path
+        the repo also ignores (node_modules/ usually is) is credited to .gitignore.
+        Such paths fall back to the Tier 1 patterns; only the repo's rules alone
+        must not make a path Tier 1.
+        """
+        if output is None:
+            return None
+        # -z --verbose records: source, line number, pattern, path
+        fields = output.split("\0")
+        tier1_paths = set()
+        for i in range(0, len(fields) - 3, 4):
+            path = fields[i + 3]
+            if fields[i] == self._tier1_excludes_file or self._matches_tier(
+                path, self._tier1_matcher
+            ):
+                tier1_paths.add(path)
+        return tier1_paths
+
+    def _git_argv(self, args: list[str]) -> list[str]:
+        """
+        Build a git command line for the working directory.
+
+        The directory is passed with -C rather than cwd=, and per-request spawns
+        use close_fds=False (Python's fds are non-inheritable by default), which
+        lets subprocess use posix_spawn instead of fork+exec of this process.
+        """
+        return [self._git_exe, "--no-optional-locks", "-C", self._resolved_cwd, *args]
+
     def _run_git(self, args: list[str], timeout: float = 1.0) -> str | None:
         """Run a git command and return output."""
+        if self._git_exe is None:
+            return None
         try:
-            # Resolve working directory (handle relative paths)
-            working_dir_path = Path(self.working_dir)
-            if not working_dir_path.is_absolute():
-                cwd = Path.cwd() / working_dir_path
-            else:
-                cwd = working_dir_path
-
+            # Capture bytes and decode once: git emits UTF-8 regardless of locale.
+            # Read-only queries never need index.lock, and stderr is never read.
             result = subprocess.run(
-                ["git"] + args,
-                capture_output=True,
-                text=True,
+                self._git_argv(args),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 timeout=timeout,
-                cwd=cwd,
+                env=self._git_env,
+                close_fds=False,
             )
             if result.returncode == 0:
-                return result.stdout.strip()
+                return result.stdout.strip().decode("utf-8", "replace")
             return None
         except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
             return None
+
+    async def _run_git_async(
+        self,
+        args: list[str],
+        timeout: float = 1.0,
+        input: str | None = None,
+        ok_returncodes: tuple[int, ...] = (0,),
+    ) -> str | None:
+        """
+        Run a git command as an asyncio subprocess and return output.
+
+        Waiting for git, and its timeout, never blocks the event loop.
+        """
+        if self._git_exe is None:
+            return None
+        proc = None
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *self._git_argv(args),
+                stdin=asyncio.subprocess.PIPE if input is not None else None,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                env=self._git_env,
+                close_fds=False,
+            )
+            stdout, _ = await asyncio.wait_for(
+                proc.communicate(input.encode("utf-8") if input is not None else None),
+                timeout=timeout,
+            )
+            if proc.returncode in ok_returncodes:
+                return stdout.strip().decode("utf-8", "replace")
+            return None
+        except asyncio.TimeoutError:
+            if proc is not None and proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+            return None
+        except (FileNotFoundError, Exception):
+            return None
+
+    async def _stream_git_async(
+        self, args: list[str], timeout: float = 1.0
+    ) -> AsyncIterator[bytes]:
+        """
+        Run a git command as an asyncio subprocess, yielding stdout chunks as they arrive.
+
+        Raises:
+            subprocess.CalledProcessError: git exited non-zero
+            asyncio.TimeoutError: git did not finish within the timeout
+            FileNotFoundError: git is not installed
+        """
+        if self._git_exe is None:
+            raise FileNotFoundError("git not found on PATH")
+        proc = await asyncio.create_subprocess_exec(
+            *self._git_argv(args),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            env=self._git_env,
+            close_fds=False,
+        )
+        deadline = asyncio.get_running_loop().time() + timeout
+        try:
+            while True:
+                remaining = deadline - asyncio.get_running_loop().time()
+                chunk = await asyncio.wait_for(
+                    proc.stdout.read(_STREAM_CHUNK_SIZE), timeout=max(remaining, 0)
+                )
+                if not chunk:
+                    break
+                yield chunk
+            remaining = deadline - asyncio.get_running_loop().time()
+            returncode = await asyncio.wait_for(proc.wait(), timeout=max(remaining, 0))
+            if returncode != 0:
+                raise subprocess.CalledProcessError(returncode, [self._git_exe, *args])
+        finally:
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
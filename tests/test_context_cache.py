@@ -0,0 +1,145 @@
+"""
+Context caching tests.
+
+These tests verify that repeated provider requests reuse previously gathered
+context while the repository is unchanged, and refresh it when it changes.
+"""
+
+import os
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from amplifier_module_hooks_status_context import EnvInfo
+from amplifier_module_hooks_status_context import StatusContextHook
+
+
+class TestContextCache:
+    """Test suite for injection caching across hook fires."""
+
+    @pytest.fixture
+    def mock_coordinator(self):
+        """Create a mock coordinator for testing."""
+        coordinator = Mock()
+        coordinator.session_id = "test-session-id"
+        coordinator.parent_id = None
+        coordinator.get_capability = Mock(return_value=None)
+        return coordinator
+
+    @pytest.fixture
+    def git_dir(self, tmp_path):
+        """Create minimal git metadata files to stat."""
+        git_dir = tmp_path / ".git"
+        git_dir.mkdir()
+        (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+        (git_dir / "index").write_bytes(b"DIRC")
+        return git_dir
+
+    @pytest.fixture
+    def hook(self, mock_coordinator, git_dir):
+        """Create a hook with the injection cache enabled and git gathering mocked out."""
+        hook = StatusContextHook(
+            mock_coordinator,
+            {"working_dir": str(git_dir.parent), "context_cache_ttl": 2.0},
+        )
+        env_info = EnvInfo(
+            working_dir=str(git_dir.parent),
+            is_git_repo=True,
+            platform="linux",
+            os_version="test",
+            date="2026-01-01",
+            session_id=None,
+            parent_session_id=None,
+            is_sub_session=False,
+            formatted="<env>\n</env>",
+        )
+        hook._gather_env_info = Mock(return_value=env_info)
+        hook._gather_git_context = AsyncMock(return_value="gitStatus: test")
+        return hook
+
+    @pytest.mark.asyncio
+    async def test_unchanged_repo_reuses_injection(self, hook):
+        """Back-to-back requests on an unchanged repo gather once."""
+        first = await hook.on_provider_request("provider:request", {})
+        second = await hook.on_provider_request("provider:request", {})
+        third = await hook.on_provider_request("provider:request", {})
+
+        assert first.context_injection == third.context_injection
+        assert second.context_injection == third.context_injection
+        assert hook._gather_git_context.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_index_change_invalidates(self, hook, git_dir):
+        """Touching the index forces a fresh gather."""
+        await hook.on_provider_request("provider:request", {})
+        stat = os.stat(git_dir / "index")
+        os.utime(git_dir / "index", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        await hook.on_provider_request("provider:request", {})
+
+        assert hook._gather_git_context.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_refreshes(self, hook):
+        """Entries older than the TTL are regathered."""
+        await hook.on_provider_request("provider:request", {})
+        with patch("amplifier_module_hooks_status_context.time.monotonic") as clock:
+            clock.return_value = 1e12
+            await hook.on_provider_request("provider:request", {})
+
+        assert hook._gather_git_context.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled(self, hook):
+        """A zero TTL gathers on every request."""
+        hook.context_cache_ttl = 0
+        for _ in range(3):
+            await hook.on_provider_request("provider:request", {})
+
+        assert hook._gather_git_context.await_count == 3
+
+    def test_key_detects_repo_for_new_working_dir(self, hook, tmp_path_factory):
+        """After a working dir change the key never reuses the old repo's mtimes."""
+        assert hook._context_cache_key()[1] is not None
+        other = tmp_path_factory.mktemp("other")
+        hook.working_dir = str(other)
+        hook.refresh_cwd()
+
+        assert hook._context_cache_key() == (str(other), None, None)
+
+    def test_cache_off_by_default(self, mock_coordinator):
+        """Edits that touch neither HEAD nor the index must not be hidden by default."""
+        hook = StatusContextHook(mock_coordinator, {})
+        assert hook.context_cache_ttl == 0
+
+    @pytest.mark.asyncio
+    async def test_min_refresh_interval_skips_checks(self, hook, git_dir):
+        """Within the minimum interval the injection is reused without any stat."""
+        hook.context_cache_ttl = 0
+        hook.min_refresh_interval = 60
+        await hook.on_provider_request("provider:request", {})
+        with patch.object(hook, "_context_cache_key") as cache_key:
+            await hook.on_provider_request("provider:request", {})
+            cache_key.assert_not_called()
+
+        assert hook._gather_git_context.await_count == 1
+
+
+class TestDisabledHook:
+    """Test suite for the all-sections-disabled fast path."""
+
+    @pytest.mark.asyncio
+    async def test_all_disabled_gathers_nothing(self):
+        """With every include_* flag off, the hook continues without work."""
+        config = {
+            "include_git": False,
+            "include_datetime": False,
+            "include_session": False,
+            "include_bundles": False,
+        }
+        hook = StatusContextHook(Mock(), config)
+        hook._gather_env_info = Mock()
+
+        result = await hook.on_provider_request("provider:request", {})
+
+        assert result.action == "continue"
+        assert result.context_injection is None
+        hook._gather_env_info.assert_not_called()
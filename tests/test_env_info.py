@@ -0,0 +1,143 @@
+"""
+Environment info tests.
+
+These tests verify the <env> block contents and that process-constant details
+are not recomputed on every hook fire.
+"""
+
+import time
+
+import pytest
+from unittest.mock import Mock, patch
+from amplifier_module_hooks_status_context import StatusContextHook
+
+
+class TestEnvInfo:
+    """Test suite for environment info gathering."""
+
+    @pytest.fixture
+    def mock_coordinator(self):
+        """Create a mock coordinator for testing."""
+        coordinator = Mock()
+        coordinator.session_id = "test-session-id"
+        coordinator.parent_id = None
+        coordinator.get_capability = Mock(return_value=None)
+        return coordinator
+
+    def test_env_block_layout(self, mock_coordinator):
+        """The env block lists fields in a fixed order."""
+        mock_coordinator.parent_id = "parent-id"
+        mock_coordinator.get_capability.return_value = Mock(
+            _bundle_mappings={"foundation": None, "design": None}
+        )
+        hook = StatusContextHook(mock_coordinator, {"working_dir": "/tmp/project"})
+        env_info = hook._gather_env_info()
+
+        lines = env_info.formatted.splitlines()
+        assert lines[:7] == [
+            "Here is useful information about the environment you are running in:",
+            "<env>",
+            "Working directory: /tmp/project",
+            "Session ID: test-session-id",
+            "Parent Session ID: parent-id",
+            "Is sub-session: Yes",
+            "Loaded bundles: design, foundation",
+        ]
+        assert lines[7].startswith("Is directory a git repo: ")
+        assert lines[8].startswith("Platform: ")
+        assert lines[9].startswith("OS Version: ")
+        assert lines[10].startswith("Today's date: ")
+        assert lines[11:] == ["</env>"]
+
+    def test_env_block_without_session(self, mock_coordinator):
+        """Session lines are omitted when session info is disabled."""
+        hook = StatusContextHook(
+            mock_coordinator, {"include_session": False, "include_bundles": False}
+        )
+        formatted = hook._gather_env_info().formatted
+
+        assert "Session ID" not in formatted
+        assert "Is sub-session" not in formatted
+        assert "Loaded bundles" not in formatted
+
+    def test_bundle_names_snapshotted(self, mock_coordinator):
+        """Bundle names are re-sorted only when the mapping changes size."""
+        mappings = {"zeta": None, "alpha": None}
+        mock_coordinator.get_capability.return_value = Mock(_bundle_mappings=mappings)
+        hook = StatusContextHook(mock_coordinator, {})
+
+        first = hook._gather_loaded_bundles()
+        assert first == ("alpha", "zeta")
+        assert hook._gather_loaded_bundles() is first
+
+        mappings["beta"] = None
+        assert hook._gather_loaded_bundles() == ("alpha", "beta", "zeta")
+
+    def test_platform_not_queried_per_call(self, mock_coordinator):
+        """Platform details come from process-level constants."""
+        hook = StatusContextHook(mock_coordinator, {"include_git": False})
+        with patch("platform.platform", side_effect=AssertionError("called")):
+            env_info = hook._gather_env_info()
+
+        assert "OS Version: " in env_info.formatted
+        assert env_info.platform != "unknown"
+
+    def test_timezone_name_follows_dst(self, mock_coordinator):
+        """The cached timezone name is selected by the current DST flag."""
+        hook = StatusContextHook(mock_coordinator, {"datetime_include_timezone": True})
+        dst_now = time.struct_time((2025, 7, 1, 12, 0, 0, 1, 182, 1))
+        with (
+            patch(
+                "amplifier_module_hooks_status_context._LOCAL_TZNAMES", ("STD", "DST")
+            ),
+            patch("amplifier_module_hooks_status_context.time.localtime", return_value=dst_now),
+        ):
+            env_info = hook._gather_env_info()
+
+        assert env_info.date.endswith(" DST")
+
+    @pytest.mark.parametrize(
+        "resolution,expected",
+        [
+            ("day", "2026-03-04"),
+            ("hour", "2026-03-04 05:00"),
+            ("minute", "2026-03-04 05:06"),
+            ("second", "2026-03-04 05:06:07"),
+        ],
+    )
+    def test_time_resolution(self, mock_coordinator, resolution, expected):
+        """The date is rounded to the configured resolution."""
+        from datetime import datetime
+
+        hook = StatusContextHook(mock_coordinator, {"time_resolution": resolution})
+        with patch("amplifier_module_hooks_status_context.datetime") as fake_datetime:
+            fake_datetime.now.return_value = datetime(2026, 3, 4, 5, 6, 7)
+            env_info = hook._gather_env_info()
+
+        assert env_info.date == expected
+
+    @pytest.mark.asyncio
+    async def test_split_volatile_context(self, mock_coordinator, tmp_path):
+        """Split mode keeps date and status out of the first reminder block."""
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+        hook = StatusContextHook(
+            mock_coordinator,
+            {"working_dir": str(tmp_path), "split_volatile_context": True},
+        )
+        sections = {
+            "branch": "Current branch: main",
+            "status": "\nStatus:\n M a.py",
+            "log": "\nRecent commits:\nabc1234 first",
+        }
+        with patch.object(hook, "_gather_git_sections", return_value=sections):
+            result = await hook.on_provider_request("provider:request", {})
+
+        stable, volatile = result.context_injection.split("</system-reminder>\n")
+        assert "Today's date" not in stable
+        assert "Current branch: main" in stable
+        assert "abc1234 first" in stable
+        assert " M a.py" not in stable
+        assert volatile.startswith('<system-reminder source="hooks-status-context">\n')
+        assert "Today's date: " in volatile
+        assert "Status:\n M a.py" in volatile
@@ -0,0 +1,663 @@
+"""
+Git context gathering tests.
+
+These tests verify that git metadata is collected with as few subprocesses as
+possible while producing the same context block.
+"""
+
+import asyncio
+import os
+import subprocess
+
+import pytest
+from contextlib import contextmanager
+from unittest.mock import AsyncMock, Mock, patch
+from amplifier_module_hooks_status_context import StatusContextHook
+from amplifier_module_hooks_status_context import _PorcelainV2Parser
+
+
+class TestGitContext:
+    """Test suite for batched git context gathering."""
+
+    @pytest.fixture
+    def mock_coordinator(self):
+        """Create a mock coordinator for testing."""
+        coordinator = Mock()
+        coordinator.session_id = "test-session-id"
+        coordinator.parent_id = None
+        return coordinator
+
+    @pytest.fixture
+    def hook(self, mock_coordinator):
+        """Create a hook with all git sections enabled."""
+        config = {
+            "working_dir": ".",
+            "git_include_commits": 3,
+        }
+        return StatusContextHook(mock_coordinator, config)
+
+    @staticmethod
+    def fake_git(outputs):
+        """Build an async _run_git_async replacement keyed on the git subcommand."""
+
+        async def run(args, timeout=1.0):
+            return outputs.get(args[0])
+
+        return AsyncMock(side_effect=run)
+
+    @staticmethod
+    def fake_stream(outputs, chunk_size=7):
+        """Build a _stream_git_async replacement that splits output into small chunks."""
+
+        async def stream(args, timeout=1.0):
+            data = outputs.get(args[0], "").encode()
+            for i in range(0, len(data), chunk_size):
+                yield data[i : i + chunk_size]
+
+        return stream
+
+    @contextmanager
+    def patched_git(self, hook, outputs):
+        """Patch both git runners with canned outputs, yielding the _run_git_async mock."""
+        run = self.fake_git(outputs)
+        with patch.object(hook, "_run_git_async", run), patch.object(
+            hook, "_stream_git_async", self.fake_stream(outputs)
+        ):
+            yield run
+
+    def test_working_dir_resolved_once(self, mock_coordinator, tmp_path, monkeypatch):
+        """Relative working_dir is resolved at init and on refresh_cwd only."""
+        monkeypatch.chdir(tmp_path)
+        hook = StatusContextHook(mock_coordinator, {"working_dir": "repo"})
+        assert hook._resolved_cwd == str(tmp_path / "repo")
+
+        (tmp_path / "other").mkdir()
+        monkeypatch.chdir(tmp_path / "other")
+        assert hook._resolved_cwd == str(tmp_path / "repo")
+
+        hook.refresh_cwd()
+        assert hook._resolved_cwd == str(tmp_path / "other" / "repo")
+
+    @staticmethod
+    def parse_branch(raw):
+        """Feed buffered status output through the parser and return its branch."""
+        parser = _PorcelainV2Parser()
+        list(parser.feed(raw.split("\0")))
+        return parser.branch
+
+    def test_parse_branch_header_with_upstream(self):
+        """Branch name is read from the branch.head record."""
+        raw = (
+            "# branch.oid 0123abc\0# branch.head feature/x\0"
+            "# branch.upstream origin/feature/x\0# branch.ab +2 -0\0"
+        )
+        assert self.parse_branch(raw) == "feature/x"
+
+    def test_parse_branch_header_no_commits(self):
+        """Unborn branches still report their name."""
+        raw = "# branch.oid (initial)\0# branch.head main\0"
+        assert self.parse_branch(raw) == "main"
+
+    def test_parse_branch_header_detached(self):
+        """Detached HEAD reports no branch."""
+        raw = "# branch.oid 0123abc\0# branch.head (detached)\0"
+        assert self.parse_branch(raw) is None
+
+    def test_parse_branch_header_missing(self):
+        """Entries without headers report no branch."""
+        assert self.parse_branch("? new.txt\0") is None
+
+    def test_status_entries_keep_short_format(self):
+        """Porcelain v2 records are rendered as short-format lines."""
+        raw = (
+            "# branch.head main\0"
+            "1 .M N... 100644 100644 100644 h1 h2 src/has space.py\0"
+            "2 R. N... 100644 100644 100644 h1 h2 R100 new.py\0old.py\0"
+            "u UU N... 100644 100644 100644 100644 h1 h2 h3 conflict.py\0"
+            "? notes.txt\0"
+        )
+        entries = list(_PorcelainV2Parser().feed(raw.split("\0")))
+        assert entries == [
+            (" M src/has space.py", " M", "src/has space.py"),
+            ("R  old.py -> new.py", "R ", "new.py"),
+            ("UU conflict.py", "UU", "conflict.py"),
+            ("?? notes.txt", "??", "notes.txt"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_branch_taken_from_status_header(self, hook):
+        """A single status call provides both branch and status lines."""
+        outputs = {
+            "status": "# branch.head main\0# branch.upstream origin/main\0"
+            "1 .M N... 100644 100644 100644 h1 h2 file.py\0",
+            "for-each-ref": "main",
+            "log": "abc1234 Initial commit",
+        }
+        with self.patched_git(hook, outputs) as run:
+            context = await hook._gather_git_context()
+
+        assert "Current branch: main" in context
+        assert "Main branch (you will usually use this for PRs): main" in context
+        assert " M file.py" in context
+        assert "abc1234 Initial commit" in context
+        subcommands = [call.args[0][0] for call in run.call_args_list]
+        assert "branch" not in subcommands
+
+    @pytest.mark.asyncio
+    async def test_clean_status_after_header(self, hook):
+        """A status with only the branch header is reported clean."""
+        outputs = {"status": "# branch.head main\0", "for-each-ref": ""}
+        with self.patched_git(hook, outputs):
+            context = await hook._gather_git_context()
+
+        assert "Status:\nWorking directory clean" in context
+
+    @pytest.mark.asyncio
+    async def test_main_branch_detection_memoized(self, hook):
+        """Main branch is probed once per working directory."""
+        outputs = {"status": "# branch.head main\0", "for-each-ref": "master"}
+        with self.patched_git(hook, outputs) as run:
+            await hook._gather_git_context()
+            context = await hook._gather_git_context()
+
+        probes = [c for c in run.call_args_list if c.args[0][0] == "for-each-ref"]
+        assert len(probes) == 1
+        assert "Main branch (you will usually use this for PRs): master" in context
+
+    @pytest.mark.asyncio
+    async def test_main_preferred_over_master(self, hook):
+        """When both exist, main is reported."""
+        outputs = {"status": "# branch.head main\0", "for-each-ref": "main\nmaster"}
+        with self.patched_git(hook, outputs):
+            context = await hook._gather_git_context()
+
+        assert "Main branch (you will usually use this for PRs): main" in context
+
+    @pytest.mark.asyncio
+    async def test_main_branch_requires_exact_name(self, hook):
+        """A "main/..." branch alone does not count as main."""
+        outputs = {"status": "# branch.head main/x\0", "for-each-ref": "main/x"}
+        with self.patched_git(hook, outputs):
+            context = await hook._gather_git_context()
+
+        assert "Main branch" not in context
+
+    @pytest.mark.asyncio
+    async def test_failed_query_keeps_other_sections(self, hook):
+        """An exception in one query does not drop the others."""
+
+        async def run(args, timeout=1.0):
+            if args[0] == "log":
+                raise RuntimeError("boom")
+            return {"for-each-ref": ""}.get(args[0])
+
+        status = {
+            "status": "# branch.head dev\0"
+            "1 .M N... 100644 100644 100644 h1 h2 a.py\0"
+        }
+        with patch.object(hook, "_run_git_async", AsyncMock(side_effect=run)), patch.object(
+            hook, "_stream_git_async", self.fake_stream(status)
+        ):
+            context = await hook._gather_git_context()
+
+        assert "Current branch: dev" in context
+        assert " M a.py" in context
+        assert "Recent commits" not in context
+
+
+class TestGitQueryCache:
+    """Test suite for ref-mtime validated git query caching."""
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        """Create a real repository on branch "dev" with one commit."""
+
+        def git(*args):
+            identity = ["-c", "user.name=t", "-c", "user.email=t@t"]
+            subprocess.run(
+                ["git", "-C", str(tmp_path), *identity, *args],
+                check=True,
+                capture_output=True,
+            )
+
+        git("init", "-q", "-b", "dev")
+        git("commit", "-q", "--allow-empty", "-m", "first")
+        return tmp_path, git
+
+    @pytest.fixture
+    def hook(self, repo):
+        """Create a hook for the repository with its git dir detected."""
+        coordinator = Mock()
+        coordinator.session_id = "test-session-id"
+        coordinator.parent_id = None
+        hook = StatusContextHook(coordinator, {"working_dir": str(repo[0])})
+        assert hook._detect_git_repo()
+        return hook
+
+    @pytest.mark.asyncio
+    async def test_log_reused_until_head_moves(self, hook, repo):
+        """The log is fetched once while HEAD stays put, and again after a commit."""
+        _, git = repo
+        run = AsyncMock(wraps=hook._run_git_async)
+        with patch.object(hook, "_run_git_async", run):
+            assert "first" in await hook._git_log()
+            await hook._git_log()
+            assert run.call_count == 1
+
+            git("commit", "-q", "--allow-empty", "-m", "second")
+            assert "second" in await hook._git_log()
+            assert run.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_log_ignores_decoration_config(self, hook, repo):
+        """log.decorate config does not add ref names to the commit lines."""
+        _, git = repo
+        git("config", "log.decorate", "full")
+        log = await hook._git_log()
+        assert log.split(" ", 1)[1] == "first"
+
+    @pytest.mark.asyncio
+    async def test_branch_shown_when_status_times_out(self, hook):
+        """A failed status call still reports the branch read from HEAD."""
+
+        async def timed_out(args, timeout=1.0):
+            raise TimeoutError
+            yield
+
+        with patch.object(hook, "_stream_git_async", timed_out):
+            context = await hook._gather_git_context()
+
+        assert "Current branch: dev" in context
+        assert "Working directory clean" not in context
+        assert "Status:\n(unavailable: git status failed or timed out)" in context
+
+    @pytest.mark.asyncio
+    async def test_main_branch_redetected_when_created(self, hook, repo):
+        """Creating a main branch invalidates a cached "no main branch" result."""
+        _, git = repo
+        assert await hook._detect_main_branch() is None
+
+        git("branch", "main")
+        assert await hook._detect_main_branch() == "main"
+
+    @pytest.mark.asyncio
+    async def test_main_branch_read_from_packed_refs(self, hook, repo):
+        """Packed branches are found without spawning git."""
+        _, git = repo
+        git("branch", "master")
+        git("pack-refs", "--all")
+        with patch.object(hook, "_run_git_async") as run:
+            assert await hook._detect_main_branch() == "master"
+            run.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_branch_read_from_head_file(self, hook, repo):
+        """Without status, the branch comes from HEAD and detached HEAD has none."""
+        _, git = repo
+        with patch.object(hook, "_run_git_async") as run:
+            assert await hook._current_branch() == "dev"
+            git("checkout", "-q", "--detach")
+            assert await hook._current_branch() is None
+            run.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_status_reused_until_worktree_changes(self, hook, repo):
+        """With a status TTL, git status reruns only after index or directory changes."""
+        tmp_path, git = repo
+        (tmp_path / "src").mkdir()
+        hook.git_status_cache_ttl = 60
+        stream = AsyncMock(wraps=hook._stream_git_status)
+        with patch.object(hook, "_stream_git_status", stream):
+            await hook._git_status_cached()
+            await hook._git_status_cached()
+            assert stream.await_count == 1
+
+            (tmp_path / "src" / "new.py").write_text("x")
+            _, status = await hook._git_status_cached()
+            assert stream.await_count == 2
+            assert "?? src/" in status
+
+            git("add", "src/new.py")
+            _, status = await hook._git_status_cached()
+            assert stream.await_count == 3
+            assert "A  src/new.py" in status
+
+    @pytest.mark.asyncio
+    async def test_status_cache_misses_nested_creation(self, hook, repo):
+        """Files created below a top-level directory are not seen until the cache expires."""
+        tmp_path, git = repo
+        (tmp_path / "src" / "pkg").mkdir(parents=True)
+        (tmp_path / "src" / "pkg" / "mod.py").write_text("x")
+        git("add", "src/pkg/mod.py")
+        hook.git_status_cache_ttl = 60
+        _, status = await hook._git_status_cached()
+        assert "A  src/pkg/mod.py" in status
+
+        (tmp_path / "src" / "pkg" / "deep.py").write_text("x")
+        _, status = await hook._git_status_cached()
+        assert "src/pkg/deep.py" not in status
+
+        hook._status_cache = None
+        _, status = await hook._git_status_cached()
+        assert "?? src/pkg/deep.py" in status
+
+    @pytest.mark.asyncio
+    async def test_git_dir_from_environment(self, repo, tmp_path_factory, monkeypatch):
+        """GIT_DIR names the repository that file reads use, as it does for git."""
+        tmp_path, git = repo
+        git("branch", "main")
+        other = tmp_path_factory.mktemp("other")
+        subprocess.run(["git", "init", "-q", "-b", "trunk", str(other)], check=True)
+        monkeypatch.setenv("GIT_DIR", str(other / ".git"))
+        hook = StatusContextHook(Mock(), {"working_dir": str(tmp_path)})
+
+        assert hook._detect_git_repo()
+        assert hook._git_dir == str(other / ".git")
+        assert await hook._current_branch() == "trunk"
+        assert await hook._detect_main_branch() is None
+
+    @pytest.mark.asyncio
+    async def test_ref_helper_reused_across_lookups(self, repo):
+        """One helper process answers repeated lookups and sees new branches."""
+        tmp_path, git = repo
+        coordinator = Mock()
+        hook = StatusContextHook(
+            coordinator, {"working_dir": str(tmp_path), "git_ref_helper": True}
+        )
+        assert hook._detect_git_repo()
+        try:
+            with (
+                patch.object(hook, "_run_git_async") as run,
+                patch.object(hook, "_read_refs_exist", return_value=None),
+            ):
+                assert await hook._detect_main_branch() is None
+                helper = hook._ref_helper
+                assert helper is not None
+
+                git("branch", "master")
+                assert await hook._detect_main_branch() == "master"
+                assert hook._ref_helper is helper
+                run.assert_not_called()
+        finally:
+            await hook.close()
+        assert hook._ref_helper is None
+
+    @pytest.mark.asyncio
+    async def test_ref_helper_closes_inherited_fds(self, hook):
+        """The long-lived helper keeps the default close_fds=True."""
+        with patch(
+            "asyncio.create_subprocess_exec", wraps=asyncio.create_subprocess_exec
+        ) as spawn:
+            try:
+                assert await hook._query_ref_helper(["refs/heads/dev"]) == [True]
+            finally:
+                await hook.close()
+        assert "close_fds" not in spawn.call_args.kwargs
+
+
+class TestStreamingStatus:
+    """Test suite for incremental git status processing."""
+
+    @pytest.fixture
+    def mock_coordinator(self):
+        """Create a mock coordinator for testing."""
+        coordinator = Mock()
+        coordinator.session_id = "test-session-id"
+        coordinator.parent_id = None
+        return coordinator
+
+    def test_rename_split_across_batches(self):
+        """A rename whose original path arrives in the next batch is still joined."""
+        parser = _PorcelainV2Parser()
+        first = list(parser.feed(["2 R. N... 100644 100644 100644 h1 h2 R100 new.py"]))
+        second = list(parser.feed(["old.py", "? notes.txt"]))
+
+        assert first == []
+        assert second == [
+            ("R  old.py -> new.py", "R ", "new.py"),
+            ("?? notes.txt", "??", "notes.txt"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_stream_real_git_output(self, mock_coordinator, tmp_path):
+        """Streaming real git output keeps exact omitted counts past the display cap."""
+        subprocess.run(["git", "init", "-q", "-b", "main", str(tmp_path)], check=True)
+        for i in range(120):
+            (tmp_path / f"file{i:03}.txt").write_text("x")
+        hook = StatusContextHook(
+            mock_coordinator,
+            {"working_dir": str(tmp_path), "git_status_max_untracked": 5},
+        )
+
+        branch, status = await hook._stream_git_status()
+
+        assert branch == "main"
+        assert status.splitlines()[:5] == [f"?? file{i:03}.txt" for i in range(5)]
+        assert "... (115 more untracked files omitted)" in status
+
+    @pytest.mark.asyncio
+    async def test_stream_failure_raises(self, mock_coordinator, tmp_path):
+        """A failing git command surfaces as an error instead of empty output."""
+        hook = StatusContextHook(mock_coordinator, {"working_dir": str(tmp_path)})
+        with pytest.raises(subprocess.CalledProcessError):
+            async for _ in hook._stream_git_async(["status", "--porcelain=v2"]):
+                pass
+
+
+class TestGitStatusArgs:
+    """Test suite for git status scan-avoidance arguments."""
+
+    @pytest.fixture
+    def mock_coordinator(self):
+        """Create a mock coordinator for testing."""
+        return Mock()
+
+    def test_untracked_scan_normal_when_included(self, mock_coordinator):
+        """Untracked files are scanned without recursing into directories."""
+        hook = StatusContextHook(mock_coordinator, {})
+        args = hook._git_status_args()
+        assert "--untracked-files=normal" in args
+        assert "--ignore-submodules=all" in args
+
+    def test_untracked_scan_skipped_when_excluded(self, mock_coordinator):
+        """Untracked scan is skipped entirely when not shown."""
+        hook = StatusContextHook(
+            mock_coordinator, {"git_status_include_untracked": False}
+        )
+        assert "--untracked-files=no" in hook._git_status_args()
+
+    def test_submodule_scan_opt_in(self, mock_coordinator):
+        """Submodules are scanned when explicitly requested."""
+        hook = StatusContextHook(
+            mock_coordinator, {"git_status_ignore_submodules": False}
+        )
+        assert "--ignore-submodules=all" not in hook._git_status_args()
+
+    def test_git_env_disables_prompts_and_tracing(self, mock_coordinator, monkeypatch):
+        """git keeps the user's environment but never traces or prompts."""
+        monkeypatch.setenv("GIT_DIR", "/srv/repo.git")
+        monkeypatch.setenv("GIT_TRACE2_PERF", "/tmp/trace")
+        hook = StatusContextHook(mock_coordinator, {})
+        assert hook._git_env["GIT_DIR"] == "/srv/repo.git"
+        assert "GIT_TRACE2_PERF" not in hook._git_env
+        assert hook._git_env["GIT_TERMINAL_PROMPT"] == "0"
+        assert hook._git_env["GIT_OPTIONAL_LOCKS"] == "0"
+
+    def test_git_resolved_once_on_path(self, mock_coordinator, monkeypatch):
+        """git is looked up at init, and a missing git never spawns a process."""
+        monkeypatch.setenv("PATH", "")
+        hook = StatusContextHook(mock_coordinator, {})
+        assert hook._git_exe is None
+        with patch("amplifier_module_hooks_status_context.subprocess.run") as run:
+            assert hook._run_git(["status"]) is None
+            run.assert_not_called()
+
+    @pytest.mark.skipif(
+        not getattr(subprocess, "_USE_POSIX_SPAWN", False),
+        reason="subprocess does not use posix_spawn on this platform",
+    )
+    def test_git_spawned_with_posix_spawn(self, mock_coordinator, tmp_path):
+        """git runs in the working directory without forking this process."""
+        hook = StatusContextHook(mock_coordinator, {"working_dir": str(tmp_path)})
+        with patch("os.posix_spawn", wraps=os.posix_spawn) as spawn:
+            assert hook._run_git(["rev-parse", "--show-prefix"]) is None
+            assert hook._run_git(["--version"]).startswith("git version")
+        assert spawn.call_count == 2
+
+    def test_uno_threshold_downgrades_large_index(self, mock_coordinator, tmp_path):
+        """Untracked scan is skipped when the index exceeds the threshold."""
+        (tmp_path / "index").write_bytes(
+            b"DIRC" + (2).to_bytes(4, "big") + (5000).to_bytes(4, "big")
+        )
+        hook = StatusContextHook(mock_coordinator, {"git_status_uno_threshold": 1000})
+        hook._git_dir = str(tmp_path)
+        assert hook._index_entry_count() == 5000
+        assert "--untracked-files=no" in hook._git_status_args()
+
+    def test_uno_threshold_keeps_small_index(self, mock_coordinator, tmp_path):
+        """Untracked scan runs when the index is under the threshold."""
+        (tmp_path / "index").write_bytes(
+            b"DIRC" + (2).to_bytes(4, "big") + (10).to_bytes(4, "big")
+        )
+        hook = StatusContextHook(mock_coordinator, {"git_status_uno_threshold": 1000})
+        hook._git_dir = str(tmp_path)
+        assert "--untracked-files=normal" in hook._git_status_args()
+
+    @pytest.mark.asyncio
+    async def test_uno_threshold_noted_in_status(self, mock_coordinator, tmp_path):
+        """A skipped untracked scan is reported rather than shown as a clean tree."""
+        (tmp_path / "index").write_bytes(
+            b"DIRC" + (2).to_bytes(4, "big") + (5000).to_bytes(4, "big")
+        )
+        hook = StatusContextHook(mock_coordinator, {"git_status_uno_threshold": 1000})
+        hook._git_dir = str(tmp_path)
+        calls = []
+
+        async def stream(args, timeout=1.0):
+            calls.append(args)
+            yield b""
+
+        with patch.object(hook, "_stream_git_async", stream):
+            _, status = await hook._stream_git_status()
+
+        assert "--untracked-files=no" in calls[0]
+        assert status == "(untracked files not scanned: index has 5000 entries)"
+
+
+class TestGitRepoDetection:
+    """Test suite for subprocess-free git repository detection."""
+
+    @pytest.fixture
+    def mock_coordinator(self):
+        """Create a mock coordinator for testing."""
+        return Mock()
+
+    def test_finds_git_dir_in_parent(self, mock_coordinator, tmp_path):
+        """A .git directory in a parent marks the working dir as a repo."""
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+        (tmp_path / "src" / "pkg").mkdir(parents=True)
+        hook = StatusContextHook(
+            mock_coordinator, {"working_dir": str(tmp_path / "src" / "pkg")}
+        )
+
+        with patch.object(hook, "_run_git") as run_git:
+            assert hook._detect_git_repo() is True
+            run_git.assert_not_called()
+        assert hook._git_dir == str(tmp_path / ".git")
+
+    def test_follows_gitdir_pointer_file(self, mock_coordinator, tmp_path):
+        """Worktree-style .git files resolve to the referenced git dir."""
+        real_git_dir = tmp_path / "main" / ".git" / "worktrees" / "wt"
+        real_git_dir.mkdir(parents=True)
+        worktree = tmp_path / "wt"
+        worktree.mkdir()
+        (worktree / ".git").write_text("gitdir: ../main/.git/worktrees/wt\n")
+        hook = StatusContextHook(mock_coordinator, {"working_dir": str(worktree)})
+
+        assert hook._detect_git_repo() is True
+        assert hook._git_dir == str(real_git_dir.resolve())
+
+    def test_not_a_repo(self, mock_coordinator, tmp_path):
+        """Directories without .git are not repos and git is not consulted."""
+        hook = StatusContextHook(mock_coordinator, {"working_dir": str(tmp_path)})
+        with (
+            patch.object(StatusContextHook, "_find_git_dir", return_value=None),
+            patch.object(hook, "_run_git") as run_git,
+        ):
+            assert hook._detect_git_repo() is False
+            run_git.assert_not_called()
+
+    def test_rev_parse_fallback_opt_in(self, mock_coordinator, tmp_path):
+        """git rev-parse is used only when explicitly enabled."""
+        hook = StatusContextHook(
+            mock_coordinator,
+            {"working_dir": str(tmp_path), "git_detect_use_rev_parse": True},
+        )
+        bare_repo = tmp_path / "repo.git"
+        bare_repo.mkdir()
+        with (
+            patch.object(StatusContextHook, "_find_git_dir", return_value=None),
+            patch.object(hook, "_run_git", return_value=str(bare_repo)) as run_git,
+        ):
+            assert hook._detect_git_repo() is True
+            assert hook._detect_git_repo() is True
+            run_git.assert_called_once()
+        assert hook._git_dir == str(bare_repo)
+
+    @pytest.mark.asyncio
+    async def test_no_git_section_without_git(
+        self, mock_coordinator, tmp_path, monkeypatch
+    ):
+        """A .git dir without a git executable is reported as no repo."""
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+        monkeypatch.setenv("PATH", "")
+        hook = StatusContextHook(mock_coordinator, {"working_dir": str(tmp_path)})
+
+        result = await hook.on_provider_request("provider:request", {})
+
+        assert "Is directory a git repo: No" in result.context_injection
+        assert "gitStatus" not in result.context_injection
+
+    @pytest.mark.asyncio
+    async def test_git_dir_and_work_tree_from_environment(
+        self, mock_coordinator, tmp_path, monkeypatch
+    ):
+        """GIT_DIR/GIT_WORK_TREE setups are detected without a .git above the cwd."""
+        subprocess.run(["git", "init", "-q", "-b", "main", str(tmp_path / "store")], check=True)
+        work_tree = tmp_path / "tree"
+        (work_tree / "src").mkdir(parents=True)
+        (work_tree / "src" / "a.py").write_text("x")
+        monkeypatch.setenv("GIT_DIR", str(tmp_path / "store" / ".git"))
+        monkeypatch.setenv("GIT_WORK_TREE", str(work_tree))
+        hook = StatusContextHook(mock_coordinator, {"working_dir": str(work_tree / "src")})
+
+        with patch.object(hook, "_run_git") as run_git:
+            result = await hook.on_provider_request("provider:request", {})
+            run_git.assert_not_called()
+
+        assert "Is directory a git repo: Yes" in result.context_injection
+        assert "Current branch: main" in result.context_injection
+        assert "?? src/" in result.context_injection
+        assert [name for name, _ in hook._worktree_fingerprint()] == ["", "src"]
+
+    def test_later_git_init_detected(self, mock_coordinator, tmp_path):
+        """A cached miss is re-checked, so a repo created mid-session is found."""
+        hook = StatusContextHook(mock_coordinator, {"working_dir": str(tmp_path)})
+        assert hook._detect_git_repo() is False
+
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+        assert hook._detect_git_repo() is True
+
+    def test_removed_git_dir_detected(self, mock_coordinator, tmp_path):
+        """A cached git dir that no longer exists is dropped."""
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+        hook = StatusContextHook(mock_coordinator, {"working_dir": str(tmp_path)})
+        assert hook._detect_git_repo() is True
+
+        (tmp_path / ".git" / "HEAD").unlink()
+        (tmp_path / ".git").rmdir()
+        assert hook._detect_git_repo() is False
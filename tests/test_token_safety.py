@@ -5,10 +5,47 @@ These tests verify that the smart truncation feature prevents token DoS attacks
 from large numbers of untracked files while preserving important tracked changes.
 """
 
+import subprocess
+
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from amplifier_module_hooks_status_context import StatusContextHook
 
+UNMERGED_CODES = {"DD", "AU", "UD", "UA", "DU", "AA", "UU"}
+
+
+def porcelain_v2(short_output):
+    """Convert `git status --short` lines into `--porcelain=v2 -z` records."""
+    records = []
+    for line in short_output.splitlines():
+        xy, path = line[:2], line[3:]
+        if xy == "??":
+            records.append(f"? {path}")
+            continue
+        xy = xy.replace(" ", ".")
+        if xy in UNMERGED_CODES:
+            records.append(f"u {xy} N... 100644 100644 100644 100644 h1 h2 h3 {path}")
+        elif " -> " in path:
+            orig, new = path.split(" -> ", 1)
+            records.append(f"2 {xy} N... 100644 100644 100644 hH hI R100 {new}")
+            records.append(orig)
+        else:
+            records.append(f"1 {xy} N... 100644 100644 100644 hH hI {path}")
+    return "".join(f"{record}\0" for record in records)
+
+
+async def stream_status(hook, raw_status, chunk_size=64):
+    """Run _stream_git_status over canned porcelain v2 output split into small chunks."""
+
+    async def stream(args, timeout=1.0):
+        data = raw_status.encode()
+        for i in range(0, len(data), chunk_size):
+            yield data[i : i + chunk_size]
+
+    with patch.object(hook, "_stream_git_async", stream):
+        _, status = await hook._stream_git_status()
+    return status
+
 
 class TestTokenSafety:
     """Test suite for token-safe git status truncation."""
@@ -40,14 +77,14 @@ class TestTokenSafety:
         }
         return StatusContextHook(mock_coordinator, config)
 
-    def test_empty_git_status(self, default_hook):
+    @pytest.mark.asyncio
+    async def test_empty_git_status(self, default_hook):
         """Empty status returns 'Working directory clean'."""
-        # Mock _run_git to return empty/None for status
-        with patch.object(default_hook, "_run_git", return_value=None):
-            status = default_hook._gather_git_status()
-            assert status == "Working directory clean"
+        status = await stream_status(default_hook, "")
+        assert status == "Working directory clean"
 
-    def test_only_tracked_changes(self, default_hook):
+    @pytest.mark.asyncio
+    async def test_only_tracked_changes(self, default_hook):
         """All tracked changes shown, no truncation."""
         # Simulate 10 tracked changes, no untracked
         tracked_files = [
@@ -64,51 +101,51 @@ class TestTokenSafety:
         ]
         git_output = "\n".join(tracked_files)
 
-        with patch.object(default_hook, "_run_git", return_value=git_output):
-            status = default_hook._gather_git_status()
-            status_lines = status.splitlines()
+        status = await stream_status(default_hook, porcelain_v2(git_output))
+        status_lines = status.splitlines()
 
-            # All tracked files should be present
-            assert len(status_lines) == len(tracked_files)
-            for tracked_file in tracked_files:
-                assert tracked_file in status_lines
+        # All tracked files should be present
+        assert len(status_lines) == len(tracked_files)
+        for tracked_file in tracked_files:
+            assert tracked_file in status_lines
 
-    def test_only_untracked_files_under_limit(self, default_hook):
+    @pytest.mark.asyncio
+    async def test_only_untracked_files_under_limit(self, default_hook):
         """<20 untracked files, all shown."""
         # Simulate 15 untracked files (under default limit of 20)
         untracked_files = [f"?? untracked{i}.txt" for i in range(15)]
         git_output = "\n".join(untracked_files)
 
-        with patch.object(default_hook, "_run_git", return_value=git_output):
-            status = default_hook._gather_git_status()
-            status_lines = status.splitlines()
+        status = await stream_status(default_hook, porcelain_v2(git_output))
+        status_lines = status.splitlines()
 
-            # All untracked files should be present
-            assert len(status_lines) == 15
-            for untracked_file in untracked_files:
-                assert untracked_file in status_lines
+        # All untracked files should be present
+        assert len(status_lines) == 15
+        for untracked_file in untracked_files:
+            assert untracked_file in status_lines
 
-    def test_many_untracked_files_truncated(self, default_hook):
+    @pytest.mark.asyncio
+    async def test_many_untracked_files_truncated(self, default_hook):
         """>20 untracked files, shows first 20 + summary."""
         # Simulate 100 untracked files (well over limit)
         untracked_files = [f"?? untracked{i:03d}.txt" for i in range(100)]
         git_output = "\n".join(untracked_files)
 
-        with patch.object(default_hook, "_run_git", return_value=git_output):
-            status = default_hook._gather_git_status()
-            status_lines = status.splitlines()
+        status = await stream_status(default_hook, porcelain_v2(git_output))
+        status_lines = status.splitlines()
 
-            # Should have 20 untracked files + 1 summary line
-            assert len(status_lines) == 21
+        # Should have 20 untracked files + 1 summary line
+        assert len(status_lines) == 21
 
-            # First 20 untracked files should be present
-            for i in range(20):
-                assert untracked_files[i] in status_lines
+        # First 20 untracked files should be present
+        for i in range(20):
+            assert untracked_files[i] in status_lines
 
-            # Summary line should indicate 80 more files omitted
-            assert "... (80 more untracked files omitted)" in status_lines
+        # Summary line should indicate 80 more files omitted
+        assert "... (80 more untracked files omitted)" in status_lines
 
-    def test_mixed_tracked_and_untracked(self, default_hook):
+    @pytest.mark.asyncio
+    async def test_mixed_tracked_and_untracked(self, default_hook):
         """All tracked shown, untracked limited."""
         # Simulate 5 tracked changes and 50 untracked files
         tracked_files = [
@@ -121,25 +158,25 @@ class TestTokenSafety:
         untracked_files = [f"?? untracked{i:03d}.txt" for i in range(50)]
         git_output = "\n".join(tracked_files + untracked_files)
 
-        with patch.object(default_hook, "_run_git", return_value=git_output):
-            status = default_hook._gather_git_status()
-            status_lines = status.splitlines()
+        status = await stream_status(default_hook, porcelain_v2(git_output))
+        status_lines = status.splitlines()
 
-            # Should have: 5 tracked + 20 untracked + 1 summary = 26 lines
-            assert len(status_lines) == 26
+        # Should have: 5 tracked + 20 untracked + 1 summary = 26 lines
+        assert len(status_lines) == 26
 
-            # All tracked files should be present
-            for tracked_file in tracked_files:
-                assert tracked_file in status_lines
+        # All tracked files should be present
+        for tracked_file in tracked_files:
+            assert tracked_file in status_lines
 
-            # First 20 untracked files should be present
-            for i in range(20):
-                assert untracked_files[i] in status_lines
+        # First 20 untracked files should be present
+        for i in range(20):
+            assert untracked_files[i] in status_lines
 
-            # Summary line should indicate 30 more files omitted
-            assert "... (30 more untracked files omitted)" in status_lines
+        # Summary line should indicate 30 more files omitted
+        assert "... (30 more untracked files omitted)" in status_lines
 
-    def test_include_untracked_false(self, mock_coordinator):
+    @pytest.mark.asyncio
+    async def test_include_untracked_false(self, mock_coordinator):
         """Skip all untracked files when disabled."""
         # Create hook with include_untracked disabled
         config = {
@@ -163,23 +200,23 @@ class TestTokenSafety:
         untracked_files = [f"?? untracked{i:03d}.txt" for i in range(100)]
         git_output = "\n".join(tracked_files + untracked_files)
 
-        with patch.object(hook, "_run_git", return_value=git_output):
-            status = hook._gather_git_status()
-            assert status is not None
-            status_lines = status.splitlines()
+        status = await stream_status(hook, porcelain_v2(git_output))
+        assert status is not None
+        status_lines = status.splitlines()
 
-            # Should have: 5 tracked files (no summary when untracked disabled)
-            assert len(status_lines) == 5
+        # Should have: 5 tracked files (no summary when untracked disabled)
+        assert len(status_lines) == 5
 
-            # All tracked files should be present
-            for tracked_file in tracked_files:
-                assert tracked_file in status_lines
+        # All tracked files should be present
+        for tracked_file in tracked_files:
+            assert tracked_file in status_lines
 
-            # No untracked files should be present
-            for untracked_file in untracked_files:
-                assert untracked_file not in status_lines
+        # No untracked files should be present
+        for untracked_file in untracked_files:
+            assert untracked_file not in status_lines
 
-    def test_max_untracked_zero_unlimited(self, mock_coordinator):
+    @pytest.mark.asyncio
+    async def test_max_untracked_zero_unlimited(self, mock_coordinator):
         """max_untracked=0 shows 0 files with summary."""
         # Create hook with max_untracked=0
         config = {
@@ -196,16 +233,16 @@ class TestTokenSafety:
         untracked_files = [f"?? untracked{i:03d}.txt" for i in range(50)]
         git_output = "\n".join(untracked_files)
 
-        with patch.object(hook, "_run_git", return_value=git_output):
-            status = hook._gather_git_status()
-            assert status is not None
-            status_lines = status.splitlines()
+        status = await stream_status(hook, porcelain_v2(git_output))
+        assert status is not None
+        status_lines = status.splitlines()
 
-            # Should only have summary (0 untracked files shown, 50 omitted)
-            assert len(status_lines) == 1
-            assert "... (50 more untracked files omitted)" in status_lines
+        # Should only have summary (0 untracked files shown, 50 omitted)
+        assert len(status_lines) == 1
+        assert "... (50 more untracked files omitted)" in status_lines
 
-    def test_max_untracked_custom_limit(self, mock_coordinator):
+    @pytest.mark.asyncio
+    async def test_max_untracked_custom_limit(self, mock_coordinator):
         """Custom limit like 50 works correctly."""
         # Create hook with custom limit of 50
         config = {
@@ -219,22 +256,22 @@ class TestTokenSafety:
         untracked_files = [f"?? untracked{i:03d}.txt" for i in range(75)]
         git_output = "\n".join(untracked_files)
 
-        with patch.object(hook, "_run_git", return_value=git_output):
-            status = hook._gather_git_status()
-            assert status is not None
-            status_lines = status.splitlines()
+        status = await stream_status(hook, porcelain_v2(git_output))
+        assert status is not None
+        status_lines = status.splitlines()
 
-            # Should have: 50 untracked + 1 summary = 51 lines
-            assert len(status_lines) == 51
+        # Should have: 50 untracked + 1 summary = 51 lines
+        assert len(status_lines) == 51
 
-            # First 50 untracked files should be present
-            for i in range(50):
-                assert untracked_files[i] in status_lines
+        # First 50 untracked files should be present
+        for i in range(50):
+            assert untracked_files[i] in status_lines
 
-            # Summary line should indicate 25 more files omitted
-            assert "... (25 more untracked files omitted)" in status_lines
+        # Summary line should indicate 25 more files omitted
+        assert "... (25 more untracked files omitted)" in status_lines
 
-    def test_hard_limit_max_lines(self, mock_coordinator):
+    @pytest.mark.asyncio
+    async def test_hard_limit_max_lines(self, mock_coordinator):
         """Hard limit truncates total output."""
         # Create hook with hard limit of 30 lines
         config = {
@@ -252,18 +289,18 @@ class TestTokenSafety:
         untracked_files = [f"?? untracked{i:03d}.txt" for i in range(100)]
         git_output = "\n".join(tracked_files + untracked_files)
 
-        with patch.object(hook, "_run_git", return_value=git_output):
-            status = hook._gather_git_status()
-            assert status is not None
-            status_lines = status.splitlines()
+        status = await stream_status(hook, porcelain_v2(git_output))
+        assert status is not None
+        status_lines = status.splitlines()
 
-            # Should have: 30 files + 1 hard limit message = 31 lines
-            assert len(status_lines) == 31
+        # Should have: 30 files + 1 hard limit message = 31 lines
+        assert len(status_lines) == 31
 
-            # Hard limit message should be present
-            assert "[Hard limit reached: output truncated to 30 lines]" in status_lines
+        # Hard limit message should be present
+        assert "[Hard limit reached: output truncated to 30 lines]" in status_lines
 
-    def test_unmerged_paths_treated_as_tracked(self, default_hook):
+    @pytest.mark.asyncio
+    async def test_unmerged_paths_treated_as_tracked(self, default_hook):
         """U, DD, AU status codes not truncated."""
         # Simulate various unmerged states + 50 untracked files
         unmerged_files = [
@@ -278,67 +315,72 @@ class TestTokenSafety:
         untracked_files = [f"?? untracked{i:03d}.txt" for i in range(50)]
         git_output = "\n".join(unmerged_files + untracked_files)
 
-        with patch.object(default_hook, "_run_git", return_value=git_output):
-            status = default_hook._gather_git_status()
-            status_lines = status.splitlines()
+        status = await stream_status(default_hook, porcelain_v2(git_output))
+        status_lines = status.splitlines()
+
+        # Should have: 7 unmerged + 20 untracked + 1 summary = 28 lines
+        assert len(status_lines) == 28
+
+        # All unmerged files should be present (not truncated)
+        for unmerged_file in unmerged_files:
+            assert unmerged_file in status_lines
 
-            # Should have: 7 unmerged + 20 untracked + 1 summary = 28 lines
-            assert len(status_lines) == 28
+        # First 20 untracked files should be present
+        for i in range(20):
+            assert untracked_files[i] in status_lines
 
-            # All unmerged files should be present (not truncated)
-            for unmerged_file in unmerged_files:
-                assert unmerged_file in status_lines
+        # Summary line should indicate 30 more files omitted
+        assert "... (30 more untracked files omitted)" in status_lines
 
-            # First 20 untracked files should be present
-            for i in range(20):
-                assert untracked_files[i] in status_lines
+    @pytest.mark.asyncio
+    async def test_git_status_failure(self, default_hook):
+        """A failed status command raises instead of reading as a clean tree."""
 
-            # Summary line should indicate 30 more files omitted
-            assert "... (30 more untracked files omitted)" in status_lines
+        async def failing(args, timeout=1.0):
+            raise subprocess.CalledProcessError(128, args)
+            yield
 
-    def test_git_status_failure(self, default_hook):
-        """Gracefully handles git command failures."""
-        # Mock _run_git to return None (simulating git command failure)
-        with patch.object(default_hook, "_run_git", return_value=None):
-            status = default_hook._gather_git_status()
-            assert status == "Working directory clean"
+        with patch.object(default_hook, "_stream_git_async", failing):
+            with pytest.raises(subprocess.CalledProcessError):
+                await default_hook._stream_git_status()
 
-    def test_truncation_message_format(self, default_hook):
+    @pytest.mark.asyncio
+    async def test_truncation_message_format(self, default_hook):
         """Verify truncation message format."""
         # Simulate 30 untracked files
         untracked_files = [f"?? untracked{i:03d}.txt" for i in range(30)]
         git_output = "\n".join(untracked_files)
 
-        with patch.object(default_hook, "_run_git", return_value=git_output):
-            status = default_hook._gather_git_status()
-            status_lines = status.splitlines()
+        status = await stream_status(default_hook, porcelain_v2(git_output))
+        status_lines = status.splitlines()
 
-            # Should have: 20 untracked + 1 summary = 21 lines
-            assert len(status_lines) == 21
+        # Should have: 20 untracked + 1 summary = 21 lines
+        assert len(status_lines) == 21
 
-            # Last line should be properly formatted
-            last_line = status_lines[-1]
-            assert last_line == "... (10 more untracked files omitted)"
+        # Last line should be properly formatted
+        last_line = status_lines[-1]
+        assert last_line == "... (10 more untracked files omitted)"
 
-    def test_pathological_case_token_consumption(self, default_hook):
+    @pytest.mark.asyncio
+    async def test_pathological_case_token_consumption(self, default_hook):
         """Verify pathological cases (10k files) result in <100 lines."""
         # Simulate pathological case: 10,000 untracked files in node_modules
         untracked_files = [f"?? node_modules/file{i:05d}.js" for i in range(10000)]
         git_output = "\n".join(untracked_files)
 
-        with patch.object(default_hook, "_run_git", return_value=git_output):
-            status = default_hook._gather_git_status()
-            status_lines = status.splitlines()
+        status = await stream_status(default_hook, porcelain_v2(git_output))
+        status_lines = status.splitlines()
 
-            # With tier-based filtering, all node_modules files are filtered (tier1)
-            # Should have just 1 filtered message (well under 100)
-            assert len(status_lines) == 1
-            assert len(status_lines) < 100
+        # With tier-based filtering, all node_modules files are filtered (tier1)
+        # Should have just 1 filtered message (well under 100)
+        assert len(status_lines) == 1
+        assert len(status_lines) < 100
 
-            # Verify filtered message
-            assert "[Filtered: 10000 untracked files in ignored paths]" in status_lines
+        # Verify filtered message
+        assert "[Filtered: 10000 untracked files in ignored paths]" in status_lines
 
-    def test_tracked_only_no_summary_line(self, default_hook):
+    @pytest.mark.asyncio
+    async def test_tracked_only_no_summary_line(self, default_hook):
         """No summary line when only tracked files are present."""
         # Simulate only tracked changes
         tracked_files = [
@@ -348,49 +390,49 @@ class TestTokenSafety:
         ]
         git_output = "\n".join(tracked_files)
 
-        with patch.object(default_hook, "_run_git", return_value=git_output):
-            status = default_hook._gather_git_status()
-            status_lines = status.splitlines()
+        status = await stream_status(default_hook, porcelain_v2(git_output))
+        status_lines = status.splitlines()
 
-            # Should only have tracked files, no summary
-            assert len(status_lines) == 3
-            assert not any("omitted" in line for line in status_lines)
+        # Should only have tracked files, no summary
+        assert len(status_lines) == 3
+        assert not any("omitted" in line for line in status_lines)
 
-    def test_exact_limit_boundary(self, default_hook):
+    @pytest.mark.asyncio
+    async def test_exact_limit_boundary(self, default_hook):
         """Exactly 20 untracked files, no truncation needed."""
         # Simulate exactly 20 untracked files (at the limit)
         untracked_files = [f"?? untracked{i:02d}.txt" for i in range(20)]
         git_output = "\n".join(untracked_files)
 
-        with patch.object(default_hook, "_run_git", return_value=git_output):
-            status = default_hook._gather_git_status()
-            status_lines = status.splitlines()
+        status = await stream_status(default_hook, porcelain_v2(git_output))
+        status_lines = status.splitlines()
 
-            # All 20 files should be present, no summary line
-            assert len(status_lines) == 20
-            assert not any("omitted" in line for line in status_lines)
+        # All 20 files should be present, no summary line
+        assert len(status_lines) == 20
+        assert not any("omitted" in line for line in status_lines)
 
-    def test_one_over_limit(self, default_hook):
+    @pytest.mark.asyncio
+    async def test_one_over_limit(self, default_hook):
         """21 untracked files triggers truncation."""
         # Simulate 21 untracked files (1 over limit)
         untracked_files = [f"?? untracked{i:02d}.txt" for i in range(21)]
         git_output = "\n".join(untracked_files)
 
-        with patch.object(default_hook, "_run_git", return_value=git_output):
-            status = default_hook._gather_git_status()
-            status_lines = status.splitlines()
+        status = await stream_status(default_hook, porcelain_v2(git_output))
+        status_lines = status.splitlines()
 
-            # Should have: 20 untracked + 1 summary = 21 lines
-            assert len(status_lines) == 21
+        # Should have: 20 untracked + 1 summary = 21 lines
+        assert len(status_lines) == 21
 
-            # First 20 files should be present
-            for i in range(20):
-                assert untracked_files[i] in status_lines
+        # First 20 files should be present
+        for i in range(20):
+            assert untracked_files[i] in status_lines
 
-            # Summary line should indicate 1 more file omitted
-            assert "... (1 more untracked files omitted)" in status_lines
+        # Summary line should indicate 1 more file omitted
+        assert "... (1 more untracked files omitted)" in status_lines
 
-    def test_hard_limit_with_only_tracked(self, mock_coordinator):
+    @pytest.mark.asyncio
+    async def test_hard_limit_with_only_tracked(self, mock_coordinator):
         """Hard limit applies even to tracked files only."""
         # Create hook with hard limit of 10
         config = {
@@ -405,35 +447,31 @@ class TestTokenSafety:
         tracked_files = [f" M tracked{i:02d}.py" for i in range(15)]
         git_output = "\n".join(tracked_files)
 
-        with patch.object(hook, "_run_git", return_value=git_output):
-            status = hook._gather_git_status()
-            assert status is not None
-            status_lines = status.splitlines()
+        status = await stream_status(hook, porcelain_v2(git_output))
+        assert status is not None
+        status_lines = status.splitlines()
 
-            # Should have: 10 files + 1 hard limit message = 11 lines
-            assert len(status_lines) == 11
+        # Should have: 10 files + 1 hard limit message = 11 lines
+        assert len(status_lines) == 11
 
-            # First 10 tracked files should be present
-            for i in range(10):
-                assert tracked_files[i] in status_lines
+        # First 10 tracked files should be present
+        for i in range(10):
+            assert tracked_files[i] in status_lines
 
-            # Hard limit message should be present
-            assert "[Hard limit reached: output truncated to 10 lines]" in status_lines
+        # Hard limit message should be present
+        assert "[Hard limit reached: output truncated to 10 lines]" in status_lines
 
-    def test_empty_output_returns_clean(self, default_hook):
+    @pytest.mark.asyncio
+    async def test_empty_output_returns_clean(self, default_hook):
         """Empty string output returns 'Working directory clean'."""
-        # Mock _run_git to return empty string
-        with patch.object(default_hook, "_run_git", return_value=""):
-            status = default_hook._gather_git_status()
-            assert status == "Working directory clean"
+        status = await stream_status(default_hook, "")
+        assert status == "Working directory clean"
 
-    def test_whitespace_only_output(self, default_hook):
-        """Whitespace-only output returns 'Working directory clean'."""
-        # In reality, _run_git strips whitespace, so whitespace-only becomes empty string
-        # which is falsy, treated same as None
-        with patch.object(default_hook, "_run_git", return_value=""):
-            status = default_hook._gather_git_status()
-            assert status == "Working directory clean"
+    @pytest.mark.asyncio
+    async def test_whitespace_only_output(self, default_hook):
+        """Output holding only a record terminator returns 'Working directory clean'."""
+        status = await stream_status(default_hook, "\0")
+        assert status == "Working directory clean"
 
 
 class TestTierBasedFiltering:
@@ -475,7 +513,8 @@ class TestTierBasedFiltering:
         }
         return StatusContextHook(mock_coordinator, config)
 
-    def test_tier1_tracked_files_filtered(self, hook_with_filtering):
+    @pytest.mark.asyncio
+    async def test_tier1_tracked_files_filtered(self, hook_with_filtering):
         """Tracked files in node_modules filtered with WARNING."""
         # Simulate tracked files in tier1 paths (node_modules, .venv)
         tier1_tracked = [
@@ -490,30 +529,30 @@ class TestTierBasedFiltering:
         ]
         git_output = "\n".join(tier1_tracked + tier3_tracked)
 
-        with patch.object(hook_with_filtering, "_run_git", return_value=git_output):
-            status = hook_with_filtering._gather_git_status()
-            status_lines = status.splitlines()
+        status = await stream_status(hook_with_filtering, porcelain_v2(git_output))
+        status_lines = status.splitlines()
 
-            # Tier 3 tracked files should be shown
-            assert "M  src/main.py" in status_lines
-            assert "A  src/utils.py" in status_lines
+        # Tier 3 tracked files should be shown
+        assert "M  src/main.py" in status_lines
+        assert "A  src/utils.py" in status_lines
 
-            # Tier 1 tracked files should NOT be in main output
-            assert "M  node_modules/package/index.js" not in status_lines[:2]
+        # Tier 1 tracked files should NOT be in main output
+        assert "M  node_modules/package/index.js" not in status_lines[:2]
 
-            # Should have WARNING message for tier1 tracked files
-            warning_found = False
-            for line in status_lines:
-                if "[WARNING:" in line and "tracked files in ignored paths]" in line:
-                    warning_found = True
-                    assert "4" in line  # 4 tracked tier1 files
-                    break
-            assert warning_found, "WARNING message not found for tier1 tracked files"
+        # Should have WARNING message for tier1 tracked files
+        warning_found = False
+        for line in status_lines:
+            if "[WARNING:" in line and "tracked files in ignored paths]" in line:
+                warning_found = True
+                assert "4" in line  # 4 tracked tier1 files
+                break
+        assert warning_found, "WARNING message not found for tier1 tracked files"
 
-            # Should show examples
-            assert any("node_modules/package/index.js" in line for line in status_lines)
+        # Should show examples
+        assert any("node_modules/package/index.js" in line for line in status_lines)
 
-    def test_tier1_untracked_files_filtered(self, hook_with_filtering):
+    @pytest.mark.asyncio
+    async def test_tier1_untracked_files_filtered(self, hook_with_filtering):
         """Untracked files in node_modules filtered silently."""
         # Simulate untracked files in tier1 paths
         tier1_untracked = [
@@ -526,28 +565,28 @@ class TestTierBasedFiltering:
         ]
         git_output = "\n".join(tier1_untracked + tier3_tracked)
 
-        with patch.object(hook_with_filtering, "_run_git", return_value=git_output):
-            status = hook_with_filtering._gather_git_status()
-            status_lines = status.splitlines()
+        status = await stream_status(hook_with_filtering, porcelain_v2(git_output))
+        status_lines = status.splitlines()
 
-            # Tier 3 tracked file should be shown
-            assert "M  src/main.py" in status_lines
+        # Tier 3 tracked file should be shown
+        assert "M  src/main.py" in status_lines
 
-            # Tier 1 untracked files should NOT be in output
-            assert "?? node_modules/package/file.js" not in status_lines
-            assert "?? .venv/lib/python3.9/site.py" not in status_lines
-            assert "?? build/output.js" not in status_lines
+        # Tier 1 untracked files should NOT be in output
+        assert "?? node_modules/package/file.js" not in status_lines
+        assert "?? .venv/lib/python3.9/site.py" not in status_lines
+        assert "?? build/output.js" not in status_lines
 
-            # Should have filtered message for tier1 untracked files
-            filtered_found = False
-            for line in status_lines:
-                if "[Filtered:" in line and "untracked files in ignored paths]" in line:
-                    filtered_found = True
-                    assert "3" in line  # 3 untracked tier1 files
-                    break
-            assert filtered_found, "Filtered message not found for tier1 untracked files"
+        # Should have filtered message for tier1 untracked files
+        filtered_found = False
+        for line in status_lines:
+            if "[Filtered:" in line and "untracked files in ignored paths]" in line:
+                filtered_found = True
+                assert "3" in line  # 3 untracked tier1 files
+                break
+        assert filtered_found, "Filtered message not found for tier1 untracked files"
 
-    def test_tier2_limited_display(self, hook_with_filtering):
+    @pytest.mark.asyncio
+    async def test_tier2_limited_display(self, hook_with_filtering):
         """Lockfiles and IDE configs limited to 10."""
         # Simulate many tier2 files (lockfiles, IDE configs)
         tier2_files = [
@@ -570,53 +609,53 @@ class TestTierBasedFiltering:
         ]
         git_output = "\n".join(tier2_files + tier3_tracked)
 
-        with patch.object(hook_with_filtering, "_run_git", return_value=git_output):
-            status = hook_with_filtering._gather_git_status()
-            status_lines = status.splitlines()
+        status = await stream_status(hook_with_filtering, porcelain_v2(git_output))
+        status_lines = status.splitlines()
 
-            # Tier 3 tracked file should be shown
-            assert "M  src/main.py" in status_lines
+        # Tier 3 tracked file should be shown
+        assert "M  src/main.py" in status_lines
 
-            # First 10 tier2 files should be present
-            assert "M  package-lock.json" in status_lines
-            assert "M  yarn.lock" in status_lines
+        # First 10 tier2 files should be present
+        assert "M  package-lock.json" in status_lines
+        assert "M  yarn.lock" in status_lines
 
-            # Should have summary for omitted tier2 files
-            summary_found = False
-            for line in status_lines:
-                if "more support files omitted" in line:
-                    summary_found = True
-                    assert "3" in line  # 3 tier2 files omitted (13 - 10)
-                    break
-            assert summary_found, "Support files omitted message not found"
+        # Should have summary for omitted tier2 files
+        summary_found = False
+        for line in status_lines:
+            if "more support files omitted" in line:
+                summary_found = True
+                assert "3" in line  # 3 tier2 files omitted (13 - 10)
+                break
+        assert summary_found, "Support files omitted message not found"
 
-    def test_tier3_tracked_limit(self, hook_with_filtering):
+    @pytest.mark.asyncio
+    async def test_tier3_tracked_limit(self, hook_with_filtering):
         """More than 50 tracked source files triggers limit."""
         # Simulate 60 tracked tier3 files
         tier3_tracked = [f"M  src/file{i:03d}.py" for i in range(60)]
         git_output = "\n".join(tier3_tracked)
 
-        with patch.object(hook_with_filtering, "_run_git", return_value=git_output):
-            status = hook_with_filtering._gather_git_status()
-            status_lines = status.splitlines()
+        status = await stream_status(hook_with_filtering, porcelain_v2(git_output))
+        status_lines = status.splitlines()
 
-            # Should show first 50 tracked files
-            assert "M  src/file000.py" in status_lines
-            assert "M  src/file049.py" in status_lines
+        # Should show first 50 tracked files
+        assert "M  src/file000.py" in status_lines
+        assert "M  src/file049.py" in status_lines
 
-            # 51st file should NOT be shown
-            assert "M  src/file050.py" not in status_lines
+        # 51st file should NOT be shown
+        assert "M  src/file050.py" not in status_lines
 
-            # Should have summary for omitted tracked files
-            summary_found = False
-            for line in status_lines:
-                if "more tracked files omitted" in line:
-                    summary_found = True
-                    assert "10" in line  # 10 tracked files omitted (60 - 50)
-                    break
-            assert summary_found, "Tracked files omitted message not found"
+        # Should have summary for omitted tracked files
+        summary_found = False
+        for line in status_lines:
+            if "more tracked files omitted" in line:
+                summary_found = True
+                assert "10" in line  # 10 tracked files omitted (60 - 50)
+                break
+        assert summary_found, "Tracked files omitted message not found"
 
-    def test_pattern_matching_directory_patterns(self, hook_with_filtering):
+    @pytest.mark.asyncio
+    async def test_pattern_matching_directory_patterns(self, hook_with_filtering):
         """Test /** patterns work correctly."""
         # Simulate files in directories with /** patterns
         files = [
@@ -627,21 +666,21 @@ class TestTierBasedFiltering:
         ]
         git_output = "\n".join(files)
 
-        with patch.object(hook_with_filtering, "_run_git", return_value=git_output):
-            status = hook_with_filtering._gather_git_status()
-            status_lines = status.splitlines()
+        status = await stream_status(hook_with_filtering, porcelain_v2(git_output))
+        status_lines = status.splitlines()
 
-            # Only tier3 file should be in main output
-            assert "M  src/main.py" in status_lines
+        # Only tier3 file should be in main output
+        assert "M  src/main.py" in status_lines
 
-            # Tier1 files should be filtered
-            assert "?? node_modules/deep/nested/file.js" not in status_lines
-            assert "?? .venv/lib/python3.9/site-packages/pkg/module.py" not in status_lines
+        # Tier1 files should be filtered
+        assert "?? node_modules/deep/nested/file.js" not in status_lines
+        assert "?? .venv/lib/python3.9/site-packages/pkg/module.py" not in status_lines
 
-            # Should have filtered/warning messages
-            assert any("[Filtered:" in line or "[WARNING:" in line for line in status_lines)
+        # Should have filtered/warning messages
+        assert any("[Filtered:" in line or "[WARNING:" in line for line in status_lines)
 
-    def test_pattern_matching_glob_patterns(self, hook_with_filtering):
+    @pytest.mark.asyncio
+    async def test_pattern_matching_glob_patterns(self, hook_with_filtering):
         """Test *.pyc style patterns."""
         # Simulate files matching glob patterns
         files = [
@@ -652,26 +691,26 @@ class TestTierBasedFiltering:
         ]
         git_output = "\n".join(files)
 
-        with patch.object(hook_with_filtering, "_run_git", return_value=git_output):
-            status = hook_with_filtering._gather_git_status()
-            status_lines = status.splitlines()
+        status = await stream_status(hook_with_filtering, porcelain_v2(git_output))
+        status_lines = status.splitlines()
 
-            # Tier3 file should be shown
-            assert "M  src/main.py" in status_lines
+        # Tier3 file should be shown
+        assert "M  src/main.py" in status_lines
 
-            # .pyc and .pyo files should be filtered
-            assert "?? module.pyc" not in status_lines
-            assert "?? another.pyo" not in status_lines
+        # .pyc and .pyo files should be filtered
+        assert "?? module.pyc" not in status_lines
+        assert "?? another.pyo" not in status_lines
 
-            # Tracked .pyc should trigger WARNING
-            warning_found = False
-            for line in status_lines:
-                if "[WARNING:" in line and "tracked files in ignored paths]" in line:
-                    warning_found = True
-                    break
-            assert warning_found, "WARNING not found for tracked .pyc file"
+        # Tracked .pyc should trigger WARNING
+        warning_found = False
+        for line in status_lines:
+            if "[WARNING:" in line and "tracked files in ignored paths]" in line:
+                warning_found = True
+                break
+        assert warning_found, "WARNING not found for tracked .pyc file"
 
-    def test_mixed_tiers_all_shown(self, hook_with_filtering):
+    @pytest.mark.asyncio
+    async def test_mixed_tiers_all_shown(self, hook_with_filtering):
         """Files from all tiers shown appropriately."""
         # Simulate files from all tiers
         tier1_untracked = [
@@ -693,24 +732,24 @@ class TestTierBasedFiltering:
         ]
         git_output = "\n".join(tier1_untracked + tier1_tracked + tier2_files + tier3_tracked + tier3_untracked)
 
-        with patch.object(hook_with_filtering, "_run_git", return_value=git_output):
-            status = hook_with_filtering._gather_git_status()
-            status_lines = status.splitlines()
+        status = await stream_status(hook_with_filtering, porcelain_v2(git_output))
+        status_lines = status.splitlines()
 
-            # Tier 3 files should be shown
-            assert "M  src/main.py" in status_lines
-            assert "A  src/utils.py" in status_lines
-            assert "?? test.txt" in status_lines
+        # Tier 3 files should be shown
+        assert "M  src/main.py" in status_lines
+        assert "A  src/utils.py" in status_lines
+        assert "?? test.txt" in status_lines
 
-            # Tier 2 files should be shown
-            assert "M  package-lock.json" in status_lines
-            assert "?? .vscode/settings.json" in status_lines
+        # Tier 2 files should be shown
+        assert "M  package-lock.json" in status_lines
+        assert "?? .vscode/settings.json" in status_lines
 
-            # Tier 1 files should have messages
-            assert any("[WARNING:" in line for line in status_lines)  # For tracked
-            assert any("[Filtered:" in line for line in status_lines)  # For untracked
+        # Tier 1 files should have messages
+        assert any("[WARNING:" in line for line in status_lines)  # For tracked
+        assert any("[Filtered:" in line for line in status_lines)  # For untracked
 
-    def test_warning_message_format(self, hook_with_filtering):
+    @pytest.mark.asyncio
+    async def test_warning_message_format(self, hook_with_filtering):
         """Verify WARNING format for tracked tier1 files."""
         # Simulate tracked files in tier1 paths
         tier1_tracked = [
@@ -722,31 +761,31 @@ class TestTierBasedFiltering:
         ]
         git_output = "\n".join(tier1_tracked)
 
-        with patch.object(hook_with_filtering, "_run_git", return_value=git_output):
-            status = hook_with_filtering._gather_git_status()
-            status_lines = status.splitlines()
+        status = await stream_status(hook_with_filtering, porcelain_v2(git_output))
+        status_lines = status.splitlines()
 
-            # Find WARNING line
-            warning_line_idx = None
-            for i, line in enumerate(status_lines):
-                if "[WARNING:" in line:
-                    warning_line_idx = i
-                    assert "5 tracked files in ignored paths]" in line
-                    break
-            assert warning_line_idx is not None, "WARNING line not found"
+        # Find WARNING line
+        warning_line_idx = None
+        for i, line in enumerate(status_lines):
+            if "[WARNING:" in line:
+                warning_line_idx = i
+                assert "5 tracked files in ignored paths]" in line
+                break
+        assert warning_line_idx is not None, "WARNING line not found"
 
-            # Should show examples (up to 3)
-            assert any("node_modules/pkg1/file.js" in line for line in status_lines)
-            assert any("node_modules/pkg2/file.js" in line for line in status_lines)
-            assert any(".venv/lib/module.py" in line for line in status_lines)
+        # Should show examples (up to 3)
+        assert any("node_modules/pkg1/file.js" in line for line in status_lines)
+        assert any("node_modules/pkg2/file.js" in line for line in status_lines)
+        assert any(".venv/lib/module.py" in line for line in status_lines)
 
-            # Should have "and X more" message
-            assert any("and 2 more" in line for line in status_lines)
+        # Should have "and X more" message
+        assert any("and 2 more" in line for line in status_lines)
 
-            # Should have suggestion
-            assert any("[Suggestion: These directories should not be tracked]" in line for line in status_lines)
+        # Should have suggestion
+        assert any("[Suggestion: These directories should not be tracked]" in line for line in status_lines)
 
-    def test_filtering_disabled(self, hook_without_filtering):
+    @pytest.mark.asyncio
+    async def test_filtering_disabled(self, hook_without_filtering):
         """When path filtering disabled, all shown (subject to hard limit)."""
         # Simulate files that would be filtered if filtering was enabled
         files = [
@@ -756,20 +795,20 @@ class TestTierBasedFiltering:
         ]
         git_output = "\n".join(files)
 
-        with patch.object(hook_without_filtering, "_run_git", return_value=git_output):
-            status = hook_without_filtering._gather_git_status()
-            status_lines = status.splitlines()
+        status = await stream_status(hook_without_filtering, porcelain_v2(git_output))
+        status_lines = status.splitlines()
 
-            # All files should be shown (no filtering)
-            assert "?? node_modules/pkg/file.js" in status_lines
-            assert "M  .venv/lib/module.py" in status_lines
-            assert "M  src/main.py" in status_lines
+        # All files should be shown (no filtering)
+        assert "?? node_modules/pkg/file.js" in status_lines
+        assert "M  .venv/lib/module.py" in status_lines
+        assert "M  src/main.py" in status_lines
 
-            # No WARNING or Filtered messages
-            assert not any("[WARNING:" in line for line in status_lines)
-            assert not any("[Filtered:" in line for line in status_lines)
+        # No WARNING or Filtered messages
+        assert not any("[WARNING:" in line for line in status_lines)
+        assert not any("[Filtered:" in line for line in status_lines)
 
-    def test_custom_tier1_patterns(self, mock_coordinator):
+    @pytest.mark.asyncio
+    async def test_custom_tier1_patterns(self, mock_coordinator):
         """User can extend tier1 patterns."""
         # Create hook with custom tier1 patterns
         config = {
@@ -788,26 +827,26 @@ class TestTierBasedFiltering:
         ]
         git_output = "\n".join(files)
 
-        with patch.object(hook, "_run_git", return_value=git_output):
-            status = hook._gather_git_status()
-            assert status is not None
-            status_lines = status.splitlines()
+        status = await stream_status(hook, porcelain_v2(git_output))
+        assert status is not None
+        status_lines = status.splitlines()
 
-            # Tier3 file should be shown
-            assert "M  src/main.py" in status_lines
+        # Tier3 file should be shown
+        assert "M  src/main.py" in status_lines
 
-            # Custom tier1 patterns should be filtered
-            assert "?? custom_ignore/file.txt" not in status_lines
+        # Custom tier1 patterns should be filtered
+        assert "?? custom_ignore/file.txt" not in status_lines
 
-            # Tracked custom tier1 pattern should trigger WARNING
-            warning_found = False
-            for line in status_lines:
-                if "[WARNING:" in line:
-                    warning_found = True
-                    break
-            assert warning_found, "WARNING not found for custom tier1 tracked file"
+        # Tracked custom tier1 pattern should trigger WARNING
+        warning_found = False
+        for line in status_lines:
+            if "[WARNING:" in line:
+                warning_found = True
+                break
+        assert warning_found, "WARNING not found for custom tier1 tracked file"
 
-    def test_hard_limit_with_filtering(self, mock_coordinator):
+    @pytest.mark.asyncio
+    async def test_hard_limit_with_filtering(self, mock_coordinator):
         """Hard limit still applies even with tier filtering."""
         # Create hook with low hard limit
         config = {
@@ -822,24 +861,24 @@ class TestTierBasedFiltering:
         tier3_tracked = [f"M  src/file{i:03d}.py" for i in range(30)]
         git_output = "\n".join(tier3_tracked)
 
-        with patch.object(hook, "_run_git", return_value=git_output):
-            status = hook._gather_git_status()
-            assert status is not None
-            status_lines = status.splitlines()
+        status = await stream_status(hook, porcelain_v2(git_output))
+        assert status is not None
+        status_lines = status.splitlines()
 
-            # Should be truncated to hard limit + 1 for message
-            assert len(status_lines) <= 16  # 15 + 1 for hard limit message
+        # Should be truncated to hard limit + 1 for message
+        assert len(status_lines) <= 16  # 15 + 1 for hard limit message
 
-            # Should have hard limit message
-            hard_limit_found = False
-            for line in status_lines:
-                if "[Hard limit reached:" in line:
-                    hard_limit_found = True
-                    assert "15 lines]" in line
-                    break
-            assert hard_limit_found, "Hard limit message not found"
+        # Should have hard limit message
+        hard_limit_found = False
+        for line in status_lines:
+            if "[Hard limit reached:" in line:
+                hard_limit_found = True
+                assert "15 lines]" in line
+                break
+        assert hard_limit_found, "Hard limit message not found"
 
-    def test_all_files_in_tier1(self, hook_with_filtering):
+    @pytest.mark.asyncio
+    async def test_all_files_in_tier1(self, hook_with_filtering):
         """All files in ignored paths shows appropriate message."""
         # Simulate only tier1 files
         tier1_untracked = [
@@ -852,20 +891,20 @@ class TestTierBasedFiltering:
         ]
         git_output = "\n".join(tier1_untracked + tier1_tracked)
 
-        with patch.object(hook_with_filtering, "_run_git", return_value=git_output):
-            status = hook_with_filtering._gather_git_status()
-            status_lines = status.splitlines()
+        status = await stream_status(hook_with_filtering, porcelain_v2(git_output))
+        status_lines = status.splitlines()
 
-            # Should have WARNING for tracked
-            assert any("[WARNING:" in line and "1 tracked" in line for line in status_lines)
+        # Should have WARNING for tracked
+        assert any("[WARNING:" in line and "1 tracked" in line for line in status_lines)
 
-            # Should have Filtered message for untracked
-            assert any("[Filtered:" in line and "3 untracked" in line for line in status_lines)
+        # Should have Filtered message for untracked
+        assert any("[Filtered:" in line and "3 untracked" in line for line in status_lines)
 
-            # Should show example of tracked tier1 file
-            assert any("build/output.js" in line for line in status_lines)
+        # Should show example of tracked tier1 file
+        assert any("build/output.js" in line for line in status_lines)
 
-    def test_tier2_untracked_and_tracked_mixed(self, hook_with_filtering):
+    @pytest.mark.asyncio
+    async def test_tier2_untracked_and_tracked_mixed(self, hook_with_filtering):
         """Tier2 files include both tracked and untracked."""
         # Simulate mixed tier2 files
         tier2_files = [
@@ -879,20 +918,20 @@ class TestTierBasedFiltering:
         ]
         git_output = "\n".join(tier2_files + tier3_tracked)
 
-        with patch.object(hook_with_filtering, "_run_git", return_value=git_output):
-            status = hook_with_filtering._gather_git_status()
-            status_lines = status.splitlines()
+        status = await stream_status(hook_with_filtering, porcelain_v2(git_output))
+        status_lines = status.splitlines()
 
-            # All tier2 files should be shown (under limit)
-            assert "M  package-lock.json" in status_lines
-            assert "?? yarn.lock" in status_lines
-            assert "M  .vscode/settings.json" in status_lines
-            assert "?? .idea/workspace.xml" in status_lines
+        # All tier2 files should be shown (under limit)
+        assert "M  package-lock.json" in status_lines
+        assert "?? yarn.lock" in status_lines
+        assert "M  .vscode/settings.json" in status_lines
+        assert "?? .idea/workspace.xml" in status_lines
 
-            # Tier3 file should be shown
-            assert "M  src/main.py" in status_lines
+        # Tier3 file should be shown
+        assert "M  src/main.py" in status_lines
 
-    def test_tier3_untracked_respects_max_untracked(self, hook_with_filtering):
+    @pytest.mark.asyncio
+    async def test_tier3_untracked_respects_max_untracked(self, hook_with_filtering):
         """Tier3 untracked files respect max_untracked limit."""
         # Simulate many tier3 untracked files
         tier3_untracked = [f"?? file{i:03d}.txt" for i in range(30)]
@@ -901,25 +940,176 @@ class TestTierBasedFiltering:
         ]
         git_output = "\n".join(tier3_tracked + tier3_untracked)
 
-        with patch.object(hook_with_filtering, "_run_git", return_value=git_output):
-            status = hook_with_filtering._gather_git_status()
-            status_lines = status.splitlines()
+        status = await stream_status(hook_with_filtering, porcelain_v2(git_output))
+        status_lines = status.splitlines()
+
+        # Tracked file should be shown
+        assert "M  src/main.py" in status_lines
+
+        # Should show first 20 untracked files (max_untracked=20)
+        assert "?? file000.txt" in status_lines
+        assert "?? file019.txt" in status_lines
+
+        # 21st file should NOT be shown
+        assert "?? file020.txt" not in status_lines
+
+        # Should have summary for omitted untracked files
+        summary_found = False
+        for line in status_lines:
+            if "more untracked files omitted" in line:
+                summary_found = True
+                assert "10" in line  # 10 untracked files omitted (30 - 20)
+                break
+        assert summary_found, "Untracked files omitted message not found"
+
+    def test_compiled_tiers_match_per_pattern_globs(self, hook_with_filtering):
+        """Compiled tier matchers agree with matching each pattern individually."""
+        import fnmatch
+
+        def matches_individually(filepath, patterns):
+            for pattern in patterns:
+                if pattern.endswith("/**"):
+                    if filepath.startswith(pattern[:-3]):
+                        return True
+                elif fnmatch.fnmatchcase(filepath, pattern):
+                    return True
+            return False
+
+        paths = [
+            "node_modules/pkg/index.js",
+            "src/__pycache__/mod.cpython-311.pyc",
+            "pkg/module.pyo",
+            "yarn.lock",
+            "web/vendor.min.js",
+            "logs/app.log",
+            ".vscode/settings.json",
+            "src/main.py",
+            "README.md",
+            "docs/build.md",
+        ]
+        for filepath in paths:
+            assert hook_with_filtering._matches_tier(
+                filepath, hook_with_filtering._tier1_matcher
+            ) == matches_individually(filepath, hook_with_filtering.tier1_patterns)
+            assert hook_with_filtering._matches_tier(
+                filepath, hook_with_filtering._tier2_matcher
+            ) == matches_individually(filepath, hook_with_filtering.tier2_patterns)
 
-            # Tracked file should be shown
-            assert "M  src/main.py" in status_lines
 
-            # Should show first 20 untracked files (max_untracked=20)
-            assert "?? file000.txt" in status_lines
-            assert "?? file019.txt" in status_lines
+class TestCheckIgnoreTier1:
+    """Test suite for Tier 1 matching via `git check-ignore`."""
 
-            # 21st file should NOT be shown
-            assert "?? file020.txt" not in status_lines
+    @pytest.fixture
+    def hook(self, tmp_path):
+        """Create a hook with check-ignore matching in a fresh repo."""
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+        # Repo rules must not leak into Tier 1
+        (tmp_path / ".gitignore").write_text("*.md\n")
+        config = {
+            "working_dir": str(tmp_path),
+            "git_status_tier1_check_ignore": True,
+        }
+        return StatusContextHook(Mock(), config)
+
+    @pytest.mark.asyncio
+    async def test_matches_tier1_patterns(self, hook):
+        """Tier 1 paths are filtered using git's matcher."""
+        git_output = "\n".join(
+            [
+                "?? node_modules/pkg/index.js",
+                "M  src/cache.pyc",
+                "M  src/main.py",
+                "M  README.md",
+            ]
+        )
+        status = await stream_status(hook, porcelain_v2(git_output))
+        status_lines = status.splitlines()
+
+        assert "M  src/main.py" in status_lines
+        assert "M  README.md" in status_lines
+        assert "?? node_modules/pkg/index.js" not in status_lines
+        assert "[WARNING: 1 tracked files in ignored paths]" in status_lines
+        assert "[Filtered: 1 untracked files in ignored paths]" in status_lines
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_regex_on_failure(self, hook):
+        """A failed check-ignore call falls back to the compiled matcher."""
+        with patch.object(hook, "_run_git_async", AsyncMock(return_value=None)):
+            assert await hook._check_ignore_tier1(["node_modules/a.js"]) is None
+            status = await stream_status(
+                hook, porcelain_v2("?? node_modules/a.js\n M src/main.py")
+            )
+
+        assert status.splitlines()[0] == " M src/main.py"
+        assert "[Filtered: 1 untracked files in ignored paths]" in status
+
+    @pytest.mark.asyncio
+    async def test_paths_resolved_from_repo_root(self, tmp_path):
+        """Root-relative status paths match when working_dir is a subdirectory."""
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+        (tmp_path / "pkg").mkdir()
+        config = {
+            "working_dir": str(tmp_path / "pkg"),
+            "git_status_tier1_check_ignore": True,
+        }
+        hook = StatusContextHook(Mock(), config)
+
+        assert await hook._check_ignore_tier1(["node_modules/a.js", "pkg/main.py"]) == {
+            "node_modules/a.js"
+        }
+
+    @pytest.mark.asyncio
+    async def test_streamed_status_awaits_check_ignore(self, hook, tmp_path):
+        """The streaming path runs check-ignore without blocking subprocess calls."""
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / "node_modules" / "a.js").write_text("x")
+        (tmp_path / "main.py").write_text("x")
+
+        with patch("amplifier_module_hooks_status_context.subprocess.run") as run:
+            _, status = await hook._stream_git_status()
+            run.assert_not_called()
+
+        assert "?? main.py" in status.splitlines()
+        assert "?? node_modules/" not in status.splitlines()
+        assert "[Filtered: 1 untracked files in ignored paths]" in status
+
+    @pytest.mark.asyncio
+    async def test_tracked_path_ignored_by_repo_gitignore(self, tmp_path):
+        """Tier 1 paths the repo's .gitignore also matches still count as Tier 1."""
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+        (tmp_path / ".gitignore").write_text("node_modules/\n")
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / "node_modules" / "a.js").write_text("x")
+        subprocess.run(
+            ["git", "-C", str(tmp_path), "add", "-f", "node_modules/a.js"], check=True
+        )
+        config = {
+            "working_dir": str(tmp_path),
+            "git_status_tier1_check_ignore": True,
+        }
+        hook = StatusContextHook(Mock(), config)
+
+        assert await hook._check_ignore_tier1(["node_modules/a.js"]) == {
+            "node_modules/a.js"
+        }
+        _, status = await hook._stream_git_status()
+        assert "[WARNING: 1 tracked files in ignored paths]" in status.splitlines()
+
+    @pytest.mark.asyncio
+    async def test_repo_root_refreshed_with_working_dir(self, tmp_path, monkeypatch):
+        """The repo-root offset is looked up again after refresh_cwd()."""
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+        (tmp_path / "pkg").mkdir()
+        monkeypatch.chdir(tmp_path)
+        config = {"working_dir": ".", "git_status_tier1_check_ignore": True}
+        hook = StatusContextHook(Mock(), config)
+        assert await hook._check_ignore_tier1(["node_modules/a.js"]) == {
+            "node_modules/a.js"
+        }
 
-            # Should have summary for omitted untracked files
-            summary_found = False
-            for line in status_lines:
-                if "more untracked files omitted" in line:
-                    summary_found = True
-                    assert "10" in line  # 10 untracked files omitted (30 - 20)
-                    break
-            assert summary_found, "Untracked files omitted message not found"
+        monkeypatch.chdir(tmp_path / "pkg")
+        hook.refresh_cwd()
+        assert await hook._check_ignore_tier1(["node_modules/a.js"]) == {
+            "node_modules/a.js"
+        }
+        assert hook._show_cdup_cache[str(tmp_path / "pkg")] == "../"